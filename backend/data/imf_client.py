@@ -1,7 +1,70 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from datetime import datetime
 
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".swansim_cache", "imf")
+CLOSED_YEARS_TTL = 30 * 24 * 3600  # Past WEO vintages are effectively immutable
+CURRENT_YEAR_TTL = 3600
+
+
+def disk_cached(fetch):
+    """
+    Caches a series fetch on disk keyed by (indicator, area, start, end).
+    The wrapped method must take indicator, start_year and end_year
+    parameters; they may be passed positionally or by keyword.
+    Empty results (failed fetches) are never cached.
+    """
+
+    def cache_path(client, indicator, start_year, end_year):
+        key = f"{indicator}|{client.area_code}|{start_year}|{end_year}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(CACHE_DIR, f"{digest}.json")
+
+    def load(path, end_year):
+        ttl = CLOSED_YEARS_TTL if int(end_year) < datetime.now().year else CURRENT_YEAR_TTL
+        try:
+            if time.time() - os.path.getmtime(path) < ttl:
+                with open(path, "r") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def store(path, series):
+        if not series:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(series, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write IMF cache {path}: {e}")
+
+    signature = inspect.signature(fetch)
+
+    @functools.wraps(fetch)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = bound.arguments
+        path = cache_path(self, params["indicator"], params["start_year"], params["end_year"])
+        series = load(path, params["end_year"])
+        if series is None:
+            series = fetch(self, *args, **kwargs)
+            store(path, series)
+        return series
+    return wrapper
+
+
 class IMFClient:
     """
     Client for International Monetary Fund (IMF) JSON REST API.
@@ -12,6 +75,16 @@ class IMFClient:
     
     def __init__(self):
         self.area_code = "IN"  # India
+
+        # Reuse TCP/TLS connections across indicator requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Releases pooled HTTP connections."""
+        self.session.close()
         
     def get_real_gdp_growth(self, start_year=2000, end_year=2024):
         """
@@ -31,6 +104,7 @@ class IMFClient:
         """
         return self._fetch_series("LUR", start_year, end_year)
 
+    @disk_cached
     def _fetch_series(self, indicator, start_year, end_year):
         """
         Generic fetch method for IMF CompactData.
@@ -46,7 +120,7 @@ class IMFClient:
         }
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -71,3 +145,4 @@ if __name__ == "__main__":
     # Test
     client = IMFClient()
     print("India GDP Growth:", client.get_real_gdp_growth(2020, 2023))
+    client.close()
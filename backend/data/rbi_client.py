@@ -1,5 +1,14 @@
 import pandas as pd
 import numpy as np
+from utils.jit import njit
+
+
+@njit(cache=True)
+def _taylor_rule(inflation, gdp_gap, target=4.0, neutral=5.5, alpha=1.5, beta=0.5):
+    # Nominal Rate = Neutral + alpha * (Inf - Target) + beta * OutputGap
+    policy_rate = neutral + alpha * (inflation - target) + beta * gdp_gap
+    return min(10.0, max(3.0, policy_rate))  # Bounds for realism
+
 
 class RBIClient:
     """
@@ -10,17 +19,25 @@ class RBIClient:
     2. Simulated forward-looking monetary policy response function.
     """
     
-    def __init__(self):
-        # Historical Indian Policy Rates (Repo Rate) approx
-        self.historical_repo_rates = {
-            2010: 5.25, 2011: 8.50, 2012: 8.00, 2013: 7.75, 2014: 8.00,
-            2015: 6.75, 2016: 6.25, 2017: 6.00, 2018: 6.50, 2019: 5.15,
-            2020: 4.00, 2021: 4.00, 2022: 6.25, 2023: 6.50, 2024: 6.50
-        }
-    
+    # Taylor rule for India (emerging market coefficients)
+    TARGET_INFLATION = 4.0
+    NEUTRAL_RATE = 5.5
+    ALPHA = 1.5  # Reaction to inflation
+    BETA = 0.5   # Reaction to output gap
+
+    # Historical Indian Policy Rates (Repo Rate) approx, shared read-only arrays
+    REPO_RATE_YEARS = np.arange(2010, 2025)
+    REPO_RATES = np.array([
+        5.25, 8.50, 8.00, 7.75, 8.00,
+        6.75, 6.25, 6.00, 6.50, 5.15,
+        4.00, 4.00, 6.25, 6.50, 6.50
+    ], dtype=np.float64)
+    REPO_RATE_YEARS.setflags(write=False)
+    REPO_RATES.setflags(write=False)
+
     def get_historical_rates(self):
-        """Returns historical repo rates."""
-        return self.historical_repo_rates
+        """Returns historical repo rates as (years, rates) arrays."""
+        return self.REPO_RATE_YEARS, self.REPO_RATES
 
     def get_current_policy_rate(self):
         """Returns the current simulated policy rate (Repo Rate)."""
@@ -34,21 +51,27 @@ class RBIClient:
         Target Inflation: 4% (+/- 2%)
         Neutral Rate: ~1-1.5% real rate -> ~5.5% nominal
         """
-        target_inflation = 4.0
-        neutral_rate = 5.5
-        
-        # Taylor rule coefficients for emerging market
-        alpha = 1.5 # Reaction to inflation
-        beta = 0.5  # Reaction to output gap
-        
-        inflation_gap = inflation - target_inflation
-        
-        # Nominal Rate = Neutral + alpha * (Inf - Target) + beta * OutputGap
-        policy_rate = neutral_rate + (alpha * inflation_gap) + (beta * gdp_gap)
-        
-        return max(3.0, min(10.0, policy_rate)) # Bounds for realism
+        return _taylor_rule(float(inflation), float(gdp_gap),
+                            self.TARGET_INFLATION, self.NEUTRAL_RATE, self.ALPHA, self.BETA)
+
+    def simulate_mpc_decision_batch(self, inflation, gdp_gap):
+        """
+        Vectorized simulate_mpc_decision for scenario sweeps.
+        inflation / gdp_gap: arrays (or scalars) broadcast elementwise.
+        """
+        inflation = np.asarray(inflation, dtype=np.float64)
+        gdp_gap = np.asarray(gdp_gap, dtype=np.float64)
+
+        policy_rate = (
+            self.NEUTRAL_RATE
+            + self.ALPHA * (inflation - self.TARGET_INFLATION)
+            + self.BETA * gdp_gap
+        )
+
+        return np.clip(policy_rate, 3.0, 10.0)
 
 if __name__ == "__main__":
     client = RBIClient()
-    print("Historical Rates:", client.get_historical_rates())
+    years, rates = client.get_historical_rates()
+    print("Historical Rates:", dict(zip(years.tolist(), rates.tolist())))
     print("Simulated Rate (Inf=6%, Gap=-1%):", client.simulate_mpc_decision(6.0, -1.0))
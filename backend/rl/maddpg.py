@@ -1,30 +1,50 @@
+import warnings
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 import numpy as np
-import random
-from collections import deque
+
+# Shared PCG64 generator for minibatch index draws
+rng = np.random.default_rng()
 
 class ReplayBuffer:
-    def __init__(self, capacity):
-        self.buffer = deque(maxlen=capacity)
+    def __init__(self, capacity, obs_dim, act_dim):
+        self.capacity = capacity
+
+        # Preallocated ring buffers (one contiguous array per field)
+        self.states = np.empty((capacity, obs_dim), dtype=np.float32)
+        self.actions = np.empty((capacity, act_dim), dtype=np.float32)
+        self.rewards = np.empty((capacity, 1), dtype=np.float32)
+        self.next_states = np.empty((capacity, obs_dim), dtype=np.float32)
+        self.dones = np.empty((capacity, 1), dtype=np.float32)
+
+        self._idx = 0
+        self._size = 0
 
     def push(self, state, action, reward, next_state, done):
-        self.buffer.append((state, action, reward, next_state, done))
+        i = self._idx
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+
+        self._idx = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
 
     def sample(self, batch_size):
-        batch = random.sample(self.buffer, batch_size)
-        state, action, reward, next_state, done = zip(*batch)
+        idx = rng.integers(0, self._size, batch_size)
         return (
-            torch.FloatTensor(np.array(state)),
-            torch.FloatTensor(np.array(action)),
-            torch.FloatTensor(np.array(reward)).unsqueeze(1),
-            torch.FloatTensor(np.array(next_state)),
-            torch.FloatTensor(np.array(done)).unsqueeze(1)
+            torch.from_numpy(self.states[idx]),
+            torch.from_numpy(self.actions[idx]),
+            torch.from_numpy(self.rewards[idx]),
+            torch.from_numpy(self.next_states[idx]),
+            torch.from_numpy(self.dones[idx])
         )
 
     def __len__(self):
-        return len(self.buffer)
+        return self._size
 
 class Actor(nn.Module):
     def __init__(self, obs_dim, act_dim):
@@ -44,8 +64,11 @@ class Actor(nn.Module):
 class Critic(nn.Module):
     def __init__(self, obs_dim, act_dim):
         super(Critic, self).__init__()
-        self.net = nn.Sequential(
-            nn.Linear(obs_dim + act_dim, 64),
+        # Linear over [obs, act] split into two input projections whose
+        # outputs are summed, avoiding a torch.cat allocation per forward
+        self.lin_obs = nn.Linear(obs_dim, 64)
+        self.lin_act = nn.Linear(act_dim, 64, bias=False)
+        self.rest = nn.Sequential(
             nn.ReLU(),
             nn.Linear(64, 64),
             nn.ReLU(),
@@ -53,7 +76,17 @@ class Critic(nn.Module):
         )
         
     def forward(self, obs, act):
-        return self.net(torch.cat([obs, act], dim=1))
+        return self.rest(self.lin_obs(obs) + self.lin_act(act))
+
+def _script(module):
+    """
+    TorchScript a small MLP to cut eager-mode dispatch overhead per forward.
+    """
+    with warnings.catch_warnings():
+        # jit.script is deprecated in favour of torch.compile, which has a
+        # heavier warm-up and guard cost for networks this small
+        warnings.simplefilter("ignore", FutureWarning)
+        return torch.jit.script(module)
 
 class MADDPG:
     def __init__(self, obs_dim, act_dim, config):
@@ -63,25 +96,37 @@ class MADDPG:
         lr_actor = config.get("rl", {}).get("lr_actor", 0.001)
         lr_critic = config.get("rl", {}).get("lr_critic", 0.002)
 
+        # BF16 autocast for forward passes; master weights and losses stay FP32
+        self.use_autocast = config.get("rl", {}).get("autocast", False)
+
         # Single Agent (Government) but structured for MADDPG expansion
-        self.actor = Actor(obs_dim, act_dim)
-        self.target_actor = Actor(obs_dim, act_dim)
+        self.actor = _script(Actor(obs_dim, act_dim))
+        self.target_actor = _script(Actor(obs_dim, act_dim))
         self.target_actor.load_state_dict(self.actor.state_dict())
         self.actor_optimizer = optim.Adam(self.actor.parameters(), lr=lr_actor)
 
-        self.critic = Critic(obs_dim, act_dim)
-        self.target_critic = Critic(obs_dim, act_dim)
+        self.critic = _script(Critic(obs_dim, act_dim))
+        self.target_critic = _script(Critic(obs_dim, act_dim))
         self.target_critic.load_state_dict(self.critic.state_dict())
         self.critic_optimizer = optim.Adam(self.critic.parameters(), lr=lr_critic)
 
-        self.memory = ReplayBuffer(100000)
+        self.memory = ReplayBuffer(100000, obs_dim, act_dim)
+
+    def select_actions(self, states, noise=0.0):
+        """
+        Batched action selection: one actor forward for all agents.
+        states: (N, obs_dim) -> actions: (N, act_dim)
+        """
+        states = torch.from_numpy(np.asarray(states, dtype=np.float32))
+        with torch.no_grad(), self._autocast():
+            actions = self.actor(states)
+        actions = actions.float().numpy()
+        if noise > 0:
+            actions += noise * rng.standard_normal(actions.shape)
+        return np.clip(actions, 0.0, 1.0)
 
     def select_action(self, state, noise=0.0):
-        state = torch.FloatTensor(state).unsqueeze(0)
-        action = self.actor(state).detach().numpy()[0]
-        if noise > 0:
-            action += noise * np.random.randn(len(action))
-        return np.clip(action, 0.0, 1.0)
+        return self.select_actions(np.asarray(state)[None], noise)[0]
 
     def update(self):
         if len(self.memory) < self.batch_size:
@@ -92,13 +137,14 @@ class MADDPG:
         # ----------------------------
         # Update Critic
         # ----------------------------
-        with torch.no_grad():
+        with torch.no_grad(), self._autocast():
             next_action = self.target_actor(next_state)
-            target_q = self.target_critic(next_state, next_action)
-            y = reward + (1 - done) * self.gamma * target_q
+            target_q = self.target_critic(next_state, next_action).float()
+        y = reward + (1 - done) * self.gamma * target_q
         
-        q_value = self.critic(state, action)
-        critic_loss = nn.MSELoss()(q_value, y)
+        with self._autocast():
+            q_value = self.critic(state, action)
+        critic_loss = F.mse_loss(q_value.float(), y)
 
         self.critic_optimizer.zero_grad()
         critic_loss.backward()
@@ -108,7 +154,9 @@ class MADDPG:
         # Update Actor
         # ----------------------------
         # Maximize Q(s, a)
-        actor_loss = -self.critic(state, self.actor(state)).mean()
+        with self._autocast():
+            q_policy = self.critic(state, self.actor(state))
+        actor_loss = -q_policy.float().mean()
 
         self.actor_optimizer.zero_grad()
         actor_loss.backward()
@@ -117,8 +165,17 @@ class MADDPG:
         # ----------------------------
         # Update Target Networks
         # ----------------------------
-        for target_param, param in zip(self.target_actor.parameters(), self.actor.parameters()):
-            target_param.data.copy_(target_param.data * (1.0 - self.tau) + param.data * self.tau)
-            
-        for target_param, param in zip(self.target_critic.parameters(), self.critic.parameters()):
-            target_param.data.copy_(target_param.data * (1.0 - self.tau) + param.data * self.tau)
+        self._soft_update(self.target_actor, self.actor)
+        self._soft_update(self.target_critic, self.critic)
+
+    def _autocast(self):
+        return torch.autocast(device_type="cpu", dtype=torch.bfloat16, enabled=self.use_autocast)
+
+    @torch.no_grad()
+    def _soft_update(self, target, source):
+        """
+        target <- (1 - tau) * target + tau * source, as fused multi-tensor ops.
+        """
+        target_params = list(target.parameters())
+        torch._foreach_mul_(target_params, 1.0 - self.tau)
+        torch._foreach_add_(target_params, list(source.parameters()), alpha=self.tau)
@@ -51,6 +51,39 @@ class RewardFunctions:
 
         return float(np.clip(reward, -5.0, 5.0))
 
+    @staticmethod
+    def household_reward_batch(
+        consumption: np.ndarray,
+        inflation: float,
+        unemployment_risk,
+        unrest_exposure,
+        alpha: float = 1.0,
+        beta: float = 1.2,
+        gamma: float = 1.5
+    ) -> np.ndarray:
+        """
+        Vectorized household_reward over a population.
+        Scalars broadcast against the per-household arrays.
+        """
+
+        # ---- Safety clipping ----
+        consumption = np.maximum(consumption, 1e-6)
+        inflation = np.clip(inflation, 0.0, 1.0)
+        unemployment_risk = np.clip(unemployment_risk, 0.0, 1.0)
+        unrest_exposure = np.clip(unrest_exposure, 0.0, 1.0)
+
+        # ---- Utility ----
+        utility = np.log(consumption)
+
+        # ---- Penalties ----
+        penalty = (
+            alpha * inflation +
+            beta * unemployment_risk +
+            gamma * unrest_exposure ** 2
+        )
+
+        return np.clip(utility - penalty, -5.0, 5.0)
+
     # -----------------------------
     # Government Reward
     # -----------------------------
@@ -98,6 +131,43 @@ class RewardFunctions:
 
         return float(np.clip(reward, -5.0, 5.0))
 
+    @staticmethod
+    def government_reward_batch(
+        gdp_growth,
+        inflation,
+        unemployment,
+        unrest,
+        inequality,
+        alpha: float = 0.8,
+        beta: float = 1.2,
+        gamma: float = 2.0,
+        delta: float = 1.0
+    ) -> np.ndarray:
+        """
+        Vectorized government_reward over a batch of macro states
+        (e.g. parallel scenarios).
+        """
+
+        # ---- Clip inputs ----
+        gdp_growth = np.clip(gdp_growth, -0.25, 0.25)
+        inflation = np.clip(inflation, 0.0, 1.0)
+        unemployment = np.clip(unemployment, 0.0, 1.0)
+        unrest = np.clip(unrest, 0.0, 1.0)
+        inequality = np.clip(inequality, 0.0, 1.0)
+
+        reward = (
+            gdp_growth
+            - alpha * inflation
+            - beta * unemployment
+            - gamma * unrest ** 2
+            - delta * inequality
+        )
+
+        # ---- Collapse penalty ----
+        reward = reward - 2.0 * ((unrest > 0.85) & (inequality > 0.6))
+
+        return np.clip(reward, -5.0, 5.0)
+
     # -----------------------------
     # Utility Function (Explicit)
     # -----------------------------
@@ -0,0 +1,19 @@
+class Column:
+    """
+    Maps a per-agent view attribute onto its element of a population array.
+    The view must expose `population` and its row index as `id`.
+    """
+
+    def __init__(self, array_name, writable=True):
+        self.array_name = array_name
+        self.writable = writable
+
+    def __get__(self, agent, owner=None):
+        if agent is None:
+            return self
+        return getattr(agent.population, self.array_name)[agent.id].item()
+
+    def __set__(self, agent, value):
+        if not self.writable:
+            raise AttributeError(f"{self.array_name} is read-only per agent")
+        getattr(agent.population, self.array_name)[agent.id] = value
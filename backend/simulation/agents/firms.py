@@ -1,51 +1,228 @@
 import numpy as np
+from simulation.agents.columns import Column
+from utils.jit import njit, NUMBA_AVAILABLE, FASTMATH
+
+
+# --------------------------------------------------
+# Firm kernels
+# --------------------------------------------------
+# One pass over all firms per phase. Serial on purpose: firm counts are
+# small enough that thread dispatch would cost more than the loop.
+
+@njit(fastmath=FASTMATH, cache=True)
+def _firms_step_jit(alive, capitals, prices, price_sensitivity, desired_labor,
+                    production, revenue, wage_bill, labor_required, wage, inflation):
+    wage_floor = max(wage, 1.0)
+    for i in range(alive.size):
+        if alive[i]:
+            desired_labor[i] = min(labor_required, np.trunc(capitals[i] / wage_floor))
+            prices[i] *= 1 + inflation * price_sensitivity[i]
+            revenue[i] = 0.0
+            wage_bill[i] = 0.0
+        else:
+            desired_labor[i] = 0.0
+            production[i] = 0.0
+
+
+def _firms_step_numpy(alive, capitals, prices, price_sensitivity, desired_labor,
+                      production, revenue, wage_bill, labor_required, wage, inflation):
+    max_labor_budget = np.trunc(capitals / max(wage, 1.0))
+    desired_labor[:] = np.where(alive, np.minimum(labor_required, max_labor_budget), 0)
+    production[~alive] = 0.0
+
+    prices *= np.where(alive, 1 + inflation * price_sensitivity, 1.0)
+
+    revenue[alive] = 0.0
+    wage_bill[alive] = 0.0
+
+
+@njit(fastmath=FASTMATH, cache=True)
+def _firms_settle_jit(alive, capitals, credit_costs, prices, production, revenue,
+                      wage_bill, employees, debt, price_multiplier, cleared,
+                      total_supply, max_leverage, interest_rate):
+    for i in range(alive.size):
+        # Goods market: reprice and take a production-weighted share of sales
+        prices[i] *= price_multiplier
+        if total_supply > 0:
+            revenue[i] = production[i] / total_supply * cleared * prices[i]
+        else:
+            revenue[i] = 0.0
+
+        # Credit market: cover negative capital up to the leverage cap
+        capital = capitals[i]
+        if capital < 0:
+            desired_credit = -capital
+            granted_credit = min(desired_credit, max_leverage * max(capital + desired_credit, 1.0))
+            capital += granted_credit
+            debt[i] += granted_credit * (1 + interest_rate)
+
+        # Accounts: profit net of wages and capital costs, then bankruptcy
+        if alive[i]:
+            capital += revenue[i] - wage_bill[i] - capital * credit_costs[i]
+            if capital < 0:
+                alive[i] = False
+                employees[i] = 0.0
+                production[i] = 0.0
+        capitals[i] = capital
+
+
+def _firms_settle_numpy(alive, capitals, credit_costs, prices, production, revenue,
+                        wage_bill, employees, debt, price_multiplier, cleared,
+                        total_supply, max_leverage, interest_rate):
+    # Goods market
+    prices *= price_multiplier
+    if total_supply > 0:
+        revenue[:] = production / total_supply * cleared * prices
+    else:
+        revenue[:] = 0.0
+
+    # Credit market
+    borrowers = capitals < 0
+    desired_credit = -capitals[borrowers]
+    granted_credit = np.minimum(desired_credit, max_leverage * np.maximum(capitals[borrowers] + desired_credit, 1))
+    capitals[borrowers] += granted_credit
+    debt[borrowers] += granted_credit * (1 + interest_rate)
+
+    # Accounts
+    profit = revenue - wage_bill - capitals * credit_costs
+    capitals += np.where(alive, profit, 0.0)
+
+    bankrupt = alive & (capitals < 0)
+    alive[bankrupt] = False
+    employees[bankrupt] = 0
+    production[bankrupt] = 0.0
+
+
+if NUMBA_AVAILABLE:
+    _firms_step = _firms_step_jit
+    _firms_settle = _firms_settle_jit
+
+    # Compile (or load from cache) at import so the first step doesn't pay JIT latency
+    _f = np.zeros(2)
+    _b = np.ones(2, dtype=bool)
+    _firms_step(_b.copy(), _f.copy(), _f.copy(), _f.copy(), _f.copy(),
+                _f.copy(), _f.copy(), _f.copy(), 1.0, 1.0, 0.0)
+    _firms_settle(_b.copy(), _f.copy(), _f.copy(), _f.copy(), _f.copy(), _f.copy(),
+                  _f.copy(), _f.copy(), _f.copy(), 1.0, 1.0, 1.0, 1.0, 0.0)
+    del _f, _b
+else:
+    _firms_step = _firms_step_numpy
+    _firms_settle = _firms_settle_numpy
+
 
 class FirmAgent:
-    def __init__(self, id, archetype, config):
-        self.id = id
-        self.archetype = archetype  # 'startup', 'sme', 'mnc'
+    """
+    Thin view over one firm of a FirmPopulation.
+    Reads and writes go straight to the population arrays, so per-firm
+    code (RL hooks, shocks, debugging) sees the same state as the
+    vectorized updates.
+    """
+
+    INITIAL_CAPITAL = {
+        'startup': 1_000.0,
+        'sme': 10_000.0,
+        'mnc': 100_000.0
+    }
+
+    # Structural advantages by archetype
+    PRODUCTIVITY = {
+        'startup': 0.8,
+        'sme': 1.0,
+        'mnc': 1.3
+    }
+
+    PRICING_POWER = {
+        'startup': 0.9,
+        'sme': 1.0,
+        'mnc': 1.2
+    }
+
+    CREDIT_COST = {
+        'startup': 0.10,
+        'sme': 0.06,
+        'mnc': 0.03
+    }
+
+    capital = Column("capitals")
+    price = Column("prices")
+    productivity = Column("productivities")
+    pricing_power = Column("pricing_powers", writable=False)
+    credit_cost = Column("credit_costs")
+    alive = Column("alive_mask")
+    desired_labor = Column("desired_labor")
+    employees = Column("employees")
+    production = Column("production")
+    revenue = Column("revenue")
+    wage_bill = Column("wage_bill")
+    debt = Column("debt")
+
+    def __init__(self, population, index):
+        self.population = population
+        self.id = index
+
+    @property
+    def archetype(self):
+        return FirmPopulation.ARCHETYPES[self.population.archetype_codes[self.id]]
+
+
+class FirmPopulation:
+    """
+    Struct-of-arrays state for every firm in the economy.
+    Each phase (step, produce, settle) is one vectorized
+    update over all firms instead of a Python call per firm.
+    Firm state stays float64: prices and capital compound every step and
+    would overflow float32 within a few dozen steps of hyperinflation,
+    while firm counts are too small for float32 to save meaningful bandwidth.
+    """
+
+    ARCHETYPES = ("startup", "sme", "mnc")
+
+    def __init__(self, archetype_codes, config):
         self.config = config
 
-        # Initial capital by archetype
-        self.capital = (
-            1_000.0 if archetype == 'startup'
-            else 10_000.0 if archetype == 'sme'
-            else 100_000.0
-        )
+        # Indices into ARCHETYPES
+        self.archetype_codes = np.asarray(archetype_codes, dtype=np.uint8)
+
+        n = len(self.archetype_codes)
+
+        # Initial capital and structural advantages by archetype
+        self.capitals = self._lookup(FirmAgent.INITIAL_CAPITAL)
+        self.productivities = self._lookup(FirmAgent.PRODUCTIVITY)
+        self.pricing_powers = self._lookup(FirmAgent.PRICING_POWER)
+        self.credit_costs = self._lookup(FirmAgent.CREDIT_COST)
+
+        # Archetype-fixed price response, folded once instead of every step
+        self._price_sensitivity = 0.5 * self.pricing_powers
+
+        self.prices = np.full(n, 10.0)
+        self.alive_mask = np.ones(n, dtype=bool)
 
-        self.employees = 0
-        self.production = 0.0
-        self.price = 10.0
-        self.alive = True
-
-        # Structural advantages
-        self.productivity = {
-            'startup': 0.8,
-            'sme': 1.0,
-            'mnc': 1.3
-        }[archetype]
-
-        self.pricing_power = {
-            'startup': 0.9,
-            'sme': 1.0,
-            'mnc': 1.2
-        }[archetype]
-
-        self.credit_cost = {
-            'startup': 0.10,
-            'sme': 0.06,
-            'mnc': 0.03
-        }[archetype]
+        # Headcounts are whole numbers stored as float64 (no int64 overflow
+        # when demand runs away during hyperinflation)
+        self.desired_labor = np.zeros(n)
+        self.employees = np.zeros(n)
+        self.production = np.zeros(n)
+        self.revenue = np.zeros(n)
+        self.wage_bill = np.zeros(n)
+        self.debt = np.zeros(n)
+
+    def _lookup(self, params):
+        table = np.array([params[a] for a in self.ARCHETYPES], dtype=np.float64)
+        return table[self.archetype_codes]
+
+    def __len__(self):
+        return len(self.archetype_codes)
+
+    def __getitem__(self, index):
+        return FirmAgent(self, index)
+
+    def __iter__(self):
+        return (FirmAgent(self, i) for i in range(len(self)))
 
     def step(self, market_conditions):
         """
-        Decide Price and Desired Labor.
+        Decide Price and Desired Labor for all firms.
         """
-        if not self.alive:
-            self.desired_labor = 0
-            self.production = 0
-            return
-
         demand = market_conditions['demand']
         wage = market_conditions['wage']
         inflation = market_conditions['inflation']
@@ -53,41 +230,33 @@ class FirmAgent:
 
         # 1. Expected demand
         # Ensure a minimum demand signal to prevent death spiral at startup
-        effective_demand = max(demand, 100.0) 
-        expected_demand = effective_demand * shock * self.productivity
+        effective_demand = max(demand, 100.0)
 
         # 2. Decide labor demand (constrained by capital)
-        # We want to produce expected_demand
-        labor_required = int(expected_demand / self.productivity)
-        
-        # Can we afford this labor?
-        max_labor_budget = self.capital / max(wage, 1.0)
-        self.desired_labor = min(labor_required, int(max_labor_budget))
-
-        # 3. Set price
-        self.price *= (1 + inflation * 0.5 * self.pricing_power)
-        
-        # Reset per-step variables
-        self.revenue = 0.0
-        self.wage_bill = 0.0
+        # Labor to meet expected demand (effective_demand * shock * productivity)
+        # is that demand over productivity, so productivity cancels and the
+        # requirement is one scalar shared by all firms
+        labor_required = np.trunc(effective_demand * shock)
+
+        # 3. Set price, reset per-step variables
+        _firms_step(
+            self.alive_mask, self.capitals, self.prices, self._price_sensitivity,
+            self.desired_labor, self.production, self.revenue, self.wage_bill,
+            float(labor_required), float(wage), float(inflation)
+        )
 
     def produce(self):
         """Called after labor market matches employees."""
-        self.production = self.employees * self.productivity
-
-    def post_market_step(self):
-        """Called after all markets clear to settle accounts."""
-        if not self.alive:
-            return
-
-        # Capital costs
-        capital_cost = self.capital * self.credit_cost
-        
-        # Profit
-        profit = self.revenue - self.wage_bill - capital_cost
-        self.capital += profit
-        
-        if self.capital < 0:
-            self.alive = False
-            self.employees = 0
-            self.production = 0.0
+        np.multiply(self.employees, self.productivities, out=self.production)
+
+    def settle(self, price_multiplier, cleared, total_supply, max_leverage, interest_rate):
+        """
+        Called once production is known to clear the goods and credit
+        markets for every firm and settle accounts, fused into one pass.
+        """
+        _firms_settle(
+            self.alive_mask, self.capitals, self.credit_costs, self.prices,
+            self.production, self.revenue, self.wage_bill, self.employees, self.debt,
+            float(price_multiplier), float(cleared), float(total_supply),
+            float(max_leverage), float(interest_rate)
+        )
@@ -25,6 +25,16 @@ class GovernmentAgent:
         self.min_controls = 0.0
         self.max_controls = 1.0
 
+        # Stacked bounds, ordered as the action vector
+        self._lo = np.array(
+            [self.min_interest, self.min_tax, self.min_welfare, self.min_controls],
+            dtype=np.float32
+        )
+        self._hi = np.array(
+            [self.max_interest, self.max_tax, self.max_welfare, self.max_controls],
+            dtype=np.float32
+        )
+
         # ---- GDP history for growth computation ----
         self.prev_gdp = None
 
@@ -39,41 +49,15 @@ class GovernmentAgent:
 
         inflation, unemployment, unrest, inequality, _ = observation
 
-        # ---- Interest rate: fight inflation, ignore growth pain ----
-        interest_rate = np.clip(
-            0.02 + 0.15 * inflation,
-            self.min_interest,
-            self.max_interest
-        )
-
-        # ---- Tax rate: redistribute only when unrest is dangerous ----
-        tax_rate = np.clip(
-            0.15 + 0.4 * inequality * unrest,
-            self.min_tax,
-            self.max_tax
-        )
-
-        # ---- Welfare: pacification mechanism ----
-        welfare_spending = np.clip(
-            0.1 + 0.5 * unrest,
-            self.min_welfare,
-            self.max_welfare
-        )
-
-        # ---- Capital controls: emergency brake ----
-        capital_controls = np.clip(
-            unrest ** 2,
-            self.min_controls,
-            self.max_controls
-        )
-
-        return np.array([
-            interest_rate,
-            tax_rate,
-            welfare_spending,
-            capital_controls
+        raw = np.array([
+            0.02 + 0.15 * inflation,           # Interest rate: fight inflation, ignore growth pain
+            0.15 + 0.4 * inequality * unrest,  # Tax rate: redistribute only when unrest is dangerous
+            0.1 + 0.5 * unrest,                # Welfare: pacification mechanism
+            unrest * unrest                    # Capital controls: emergency brake
         ], dtype=np.float32)
 
+        return np.clip(raw, self._lo, self._hi)
+
     # --------------------------------------------------
     # Reward Computation (No placeholders)
     # --------------------------------------------------
@@ -115,20 +99,16 @@ class GovernmentAgent:
     # --------------------------------------------------
     def _aggregate_unrest(self, global_state):
         """
-        Computes population-weighted unrest from households.
+        Computes population-weighted unrest from the contiguous
+        household buffers on global_state.
         """
 
-        households = global_state.households
+        sizes = global_state.household_sizes
+        unrest = global_state.household_unrest
 
-        if len(households) == 0:
+        if unrest is None or len(unrest) == 0:
             return 0.0
 
-        total_pop = 0.0
-        weighted_unrest = 0.0
-
-        for h in households:
-            pop = max(h.size, 1.0)
-            total_pop += pop
-            weighted_unrest += pop * h.unrest_level
+        weighted_unrest = np.dot(sizes, unrest) / max(sizes.sum(dtype=np.float64), 1.0)
 
-        return np.clip(weighted_unrest / total_pop, 0.0, 1.0)
+        return float(np.clip(weighted_unrest, 0.0, 1.0))
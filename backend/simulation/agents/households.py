@@ -1,11 +1,13 @@
 import numpy as np
 from rl.rewards import RewardFunctions
+from simulation.agents.columns import Column
 
 
 class HouseholdAgent:
     """
     Household agent with social learning, consumption, savings,
     and unrest behavior.
+    Thin view over one household of a HouseholdPopulation.
     """
 
     SOCIAL_CLASS_PARAMS = {
@@ -15,17 +17,21 @@ class HouseholdAgent:
         "elite": {"income_mean": 1000, "income_std": 200, "propensity_to_protest": 0.05},
     }
 
-    def __init__(self, id, social_class, config):
-        self.id = id
-        self.social_class = social_class
-        self.config = config
+    wealth = Column("wealth")
+    consumption = Column("consumption")
+    savings = Column("savings")
+    unrest = Column("unrest")
+    unrest_exposure = Column("unrest_exposure")
+    employed = Column("employed")
+    size = Column("sizes")
 
-        # Initialize wealth
-        income_params = self.SOCIAL_CLASS_PARAMS[social_class]
-        self.wealth = float(np.random.normal(income_params["income_mean"], income_params["income_std"]))
-        self.consumption = 0.0
-        self.savings = 0.0
-        self.unrest = 0.0
+    def __init__(self, population, index):
+        self.population = population
+        self.id = index
+
+    @property
+    def social_class(self):
+        return HouseholdPopulation.SOCIAL_CLASSES[self.population.class_codes[self.id]]
 
     # --------------------------------------------------
     # Action (Consumption, Savings, Protest)
@@ -49,8 +55,9 @@ class HouseholdAgent:
             action = np.array([consumption_pct, savings_pct, protest_pct], dtype=np.float32)
 
         # Update internal states
-        self.consumption = self.wealth * action[0]
-        self.savings = self.wealth * action[1]
+        wealth = self.wealth
+        self.consumption = wealth * action[0]
+        self.savings = wealth * action[1]
         self.unrest = action[2]
 
         # Update wealth after consumption (simplified)
@@ -74,24 +81,153 @@ class HouseholdAgent:
         unemployment = global_state.economics.unemployment
 
         reward = RewardFunctions.household_reward(
-            consumption_utility=RewardFunctions.utility_consumption(self.consumption),
+            consumption=self.consumption,
             inflation=inflation,
-            unemployment=unemployment,
+            unemployment_risk=unemployment,
             unrest_exposure=local_exposure
         )
 
         return reward
 
     # --------------------------------------------------
-    # Social Exposure Update (optional helper)
+    # Social Exposure Update
     # --------------------------------------------------
-    def update_unrest_from_network(self, neighbors):
+    def update_unrest_from_network(self, exposures):
         """
-        neighbors: list of HouseholdAgent
-        Simple average unrest of connected agents
+        exposures: array from HouseholdPopulation.update_exposures
         """
-        if not neighbors:
-            self.unrest_exposure = self.unrest
+        self.unrest_exposure = float(exposures[self.id])
+        return self.unrest_exposure
+
+
+class HouseholdPopulation:
+    """
+    Struct-of-arrays state for every household.
+    Row i is household id i; the order never changes, so all
+    per-household arrays stay aligned with the social graph.
+    Per-household state is float32.
+    """
+
+    SOCIAL_CLASSES = ("poor", "working", "middle", "elite")
+
+    def __init__(self, class_codes, config, rng=None):
+        self.config = config
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Indices into SOCIAL_CLASSES
+        self.class_codes = np.asarray(class_codes, dtype=np.uint8)
+
+        n = len(self.class_codes)
+
+        # Per-class parameters gathered once into aligned arrays
+        income_mean = self._lookup("income_mean")
+        income_std = self._lookup("income_std")
+        self.propensity_to_protest = self._lookup("propensity_to_protest")
+
+        # Baseline rule's consumption/savings split is fixed per class
+        self._consumption_pct = np.clip(0.5 + 0.2 * (1 - self.propensity_to_protest), 0.0, 1.0)
+        self._savings_pct = 1.0 - self._consumption_pct
+
+        # Initialize wealth
+        self.wealth = self.rng.normal(income_mean, income_std).astype(np.float32)
+        self.consumption = np.zeros(n, dtype=np.float32)
+        self.savings = np.zeros(n, dtype=np.float32)
+        self.unrest = np.zeros(n, dtype=np.float32)
+        self.unrest_exposure = np.zeros(n, dtype=np.float32)
+        self.employed = np.zeros(n, dtype=bool)
+
+        # Population weight per household
+        self.sizes = np.ones(n, dtype=np.float32)
+
+        # Action output, and the full observation matrix (built only for a policy network)
+        self._actions = np.empty((n, 3), dtype=np.float32)
+        self._obs = None
+
+    def _lookup(self, param):
+        table = np.array(
+            [HouseholdAgent.SOCIAL_CLASS_PARAMS[c][param] for c in self.SOCIAL_CLASSES],
+            dtype=np.float32
+        )
+        return table[self.class_codes]
+
+    def __len__(self):
+        return len(self.class_codes)
+
+    def __getitem__(self, index):
+        return HouseholdAgent(self, index)
+
+    def __iter__(self):
+        return (HouseholdAgent(self, i) for i in range(len(self)))
+
+    # --------------------------------------------------
+    # Action (Consumption, Savings, Protest)
+    # --------------------------------------------------
+    def act(self, macro, policy_network=None):
+        """
+        Batched HouseholdAgent.act over all households.
+        macro: (4,) [inflation, unemployment, social_unrest, gdp_growth],
+        shared by every household; personal_wealth comes from self.wealth
+
+        Returns: (N, 3) actions (consumption_pct, savings_pct, protest_pct);
+        the baseline rule reuses one buffer across calls
+        """
+
+        if policy_network is not None:
+            actions = np.asarray(policy_network(self._observations(macro)))
+            consumption_pct, savings_pct, protest_pct = actions.T
         else:
-            self.unrest_exposure = np.mean([n.unrest for n in neighbors])
+            # Baseline rule: class-fixed consumption split, protest proportional to unrest
+            actions = self._actions
+            consumption_pct, savings_pct, protest_pct = actions.T
+            consumption_pct[:] = self._consumption_pct
+            savings_pct[:] = self._savings_pct
+            np.multiply(self.propensity_to_protest, macro[2], out=protest_pct)
+            np.clip(protest_pct, 0.0, 1.0, out=protest_pct)
+
+        # Update internal states
+        np.multiply(self.wealth, consumption_pct, out=self.consumption)
+        np.multiply(self.wealth, savings_pct, out=self.savings)
+        self.unrest[:] = protest_pct
+
+        # Update wealth after consumption (simplified)
+        self.wealth[:] = self.savings
+
+        return actions
+
+    def _observations(self, macro):
+        """Full (N, 5) HouseholdAgent.act observation matrix."""
+        if self._obs is None:
+            self._obs = np.empty((len(self), 5), dtype=np.float32)
+        self._obs[:, :4] = macro
+        self._obs[:, 4] = self.wealth
+        return self._obs
+
+    # --------------------------------------------------
+    # Reward Computation
+    # --------------------------------------------------
+    def compute_rewards(self, global_state, social_graph):
+        """
+        Batched compute_reward. Exposures are refreshed here, from the
+        current unrest, since nothing else on the step path reads them.
+        social_graph: SocialGraph over household ids
+        """
+
+        self.update_exposures(social_graph)
+        return RewardFunctions.household_reward_batch(
+            consumption=self.consumption,
+            inflation=global_state.economics.inflation,
+            unemployment_risk=global_state.economics.unemployment,
+            unrest_exposure=self.unrest_exposure
+        )
+
+    # --------------------------------------------------
+    # Social Exposure Update
+    # --------------------------------------------------
+    def update_exposures(self, social_graph):
+        """
+        Social exposure for every household in one neighbor-mean pass.
+        social_graph: SocialGraph over household ids
+        Exposure is the mean unrest of connected agents (own unrest if isolated).
+        """
+        self.unrest_exposure[:] = social_graph.neighbor_mean(self.unrest)
         return self.unrest_exposure
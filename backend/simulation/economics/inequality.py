@@ -1,4 +1,42 @@
 import numpy as np
+from utils.jit import njit, NUMBA_AVAILABLE, FASTMATH
+
+
+# --------------------------------------------------
+# Gini kernels (input sorted ascending)
+# --------------------------------------------------
+@njit(fastmath=FASTMATH, cache=True)
+def _gini_sorted_jit(incomes):
+    n = incomes.size
+    rank_weighted = 0.0
+    total = 0.0
+    for i in range(n):
+        rank_weighted += (i + 1) * incomes[i]
+        total += incomes[i]
+    if total == 0.0:
+        # Offsetting debts and assets (e.g. [-1, 1]); no meaningful share
+        return 0.0
+    return (2.0 * rank_weighted - (n + 1) * total) / (n * total)
+
+
+def _gini_sorted_numpy(incomes):
+    n = incomes.shape[0]
+    total = incomes.sum(dtype=np.float64)
+    if total == 0.0:
+        return 0.0
+
+    # sum((2i - n - 1) * x_i) == 2 * (i . x) - (n + 1) * sum(x)
+    rank_weighted = np.dot(np.arange(1, n + 1, dtype=np.float64), incomes)
+
+    return (2.0 * rank_weighted - (n + 1) * total) / (n * total)
+
+
+if NUMBA_AVAILABLE:
+    _gini_sorted = _gini_sorted_jit
+    # compile (or load from cache) at import for the float32 SoA wealth
+    _gini_sorted(np.ones(2, dtype=np.float32))
+else:
+    _gini_sorted = _gini_sorted_numpy
 
 
 class InequalityMetrics:
@@ -8,9 +46,14 @@ class InequalityMetrics:
         Calculates Gini coefficient.
         Gini = 0 → perfect equality
         Gini = 1 → maximal inequality
+        incomes: ndarray (lists are still accepted)
         """
 
-        incomes = np.array(incomes, dtype=np.float64)
+        # np.sort below copies, so an ndarray input needs no copy here;
+        # float32 input stays float32 (the kernels accumulate in float64)
+        incomes = np.asarray(incomes)
+        if incomes.dtype.kind != "f":
+            incomes = incomes.astype(np.float64)
 
         if len(incomes) == 0:
             return 0.0
@@ -18,13 +61,7 @@ class InequalityMetrics:
         if np.all(incomes == 0):
             return 0.0
 
-        incomes = np.sort(incomes)
-        n = incomes.shape[0]
-        index = np.arange(1, n + 1)
-
-        gini = (
-            (2 * index - n - 1) * incomes
-        ).sum() / (n * incomes.sum())
+        gini = _gini_sorted(np.sort(incomes))
 
         return float(np.clip(gini, 0.0, 1.0))
 
@@ -35,22 +72,23 @@ class InequalityMetrics:
         Example: top_percentile=0.01 → top 1%
         """
 
-        wealths = np.array(wealths, dtype=np.float64)
+        # np.partition below copies, so an ndarray input needs no copy here
+        wealths = np.asarray(wealths)
+        if wealths.dtype.kind != "f":
+            wealths = wealths.astype(np.float64)
 
         if len(wealths) == 0:
             return 0.0
 
-        total_wealth = wealths.sum()
+        total_wealth = wealths.sum(dtype=np.float64)
         if total_wealth <= 0:
             return 0.0
 
         # Number of agents in top percentile
         k = max(1, int(np.ceil(len(wealths) * top_percentile)))
 
-        # Sort descending
-        sorted_wealths = np.sort(wealths)[::-1]
-
-        top_wealth = sorted_wealths[:k].sum()
+        # Top-k selection (introselect, O(N)) instead of a full sort
+        top_wealth = np.partition(wealths, -k)[-k:].sum(dtype=np.float64)
 
         share = top_wealth / total_wealth
 
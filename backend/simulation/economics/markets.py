@@ -1,4 +1,53 @@
 import numpy as np
+from utils.jit import njit, prange, NUMBA_AVAILABLE, FASTMATH
+
+
+# --------------------------------------------------
+# Market kernels
+# --------------------------------------------------
+# Each settlement step has a Numba kernel and a NumPy fallback with the
+# same signature; the kernel is used whenever numba is installed.
+
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def _settle_labor_jit(employed_mask, wealth, hired, wage,
+                      desired_labor, employees, wage_bill, employed, labor_demand):
+    for i in prange(employed_mask.size):
+        employed_mask[i] = False
+
+    # hired holds unique indices, so the scatter is race-free
+    for j in prange(hired.size):
+        k = hired[j]
+        employed_mask[k] = True
+        wealth[k] += wage
+
+    denom = max(labor_demand, 1.0)
+    for i in prange(desired_labor.size):
+        employees[i] = np.trunc(desired_labor[i] * employed / denom)
+        wage_bill[i] = employees[i] * wage
+
+
+def _settle_labor_numpy(employed_mask, wealth, hired, wage,
+                        desired_labor, employees, wage_bill, employed, labor_demand):
+    employed_mask[:] = False
+    employed_mask[hired] = True
+    wealth[hired] += wage
+
+    employees[:] = np.trunc(desired_labor * employed / max(labor_demand, 1))
+    np.multiply(employees, wage, out=wage_bill)
+
+
+if NUMBA_AVAILABLE:
+    _settle_labor = _settle_labor_jit
+
+    # Compile (or load from cache) at import so the first step doesn't pay JIT latency
+    # (float32 household arrays and wage, float64 firm arrays and scalars)
+    _h = np.zeros(2, dtype=np.float32)
+    _f = np.zeros(2)
+    _settle_labor(np.zeros(2, dtype=bool), _h, np.zeros(1, dtype=np.int64), np.float32(1.0),
+                  _f.copy(), _f.copy(), _f.copy(), 1, 1.0)
+    del _h, _f
+else:
+    _settle_labor = _settle_labor_numpy
 
 
 class MarketMechanism:
@@ -6,8 +55,9 @@ class MarketMechanism:
     Clears labor, goods, and credit markets each timestep.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, rng=None):
         self.config = config
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Baseline prices
         self.base_wage = config.get("base_wage", 50.0)
@@ -25,98 +75,61 @@ class MarketMechanism:
         """
         Matches household labor supply with firm labor demand.
         Updates wages, employment, and unemployment.
+        households: HouseholdPopulation, firms: FirmPopulation
         """
 
         # ---- Labor supply ----
         labor_supply = len(households)
 
         # ---- Labor demand ----
-        labor_demand = sum(f.desired_labor for f in firms)
+        labor_demand = firms.desired_labor.sum()
 
         # ---- Wage adjustment ----
         excess_demand = labor_demand - labor_supply
         wage = self.base_wage * (1 + self.wage_adjustment * np.tanh(excess_demand / max(labor_supply, 1)))
 
         # ---- Employment matching ----
-        employed = min(labor_supply, labor_demand)
+        # (shock-driven negative capital can make labor demand negative)
+        employed = int(max(0, min(labor_supply, labor_demand)))
         unemployment_rate = 1.0 - employed / labor_supply
 
-        # Assign workers randomly
-        np.random.shuffle(households)
-        employed_households = households[:employed]
-
-        for h in households:
-            h.employed = False
+        # Assign workers randomly: sample unique household ids without
+        # permuting all N (order is irrelevant, households stay in place)
+        hired = self.rng.choice(labor_supply, size=employed, replace=False, shuffle=False)
 
-        for h in employed_households:
-            h.employed = True
-            h.wealth += wage
-
-        for f in firms:
-            f.employees = int(
-                f.desired_labor * employed / max(labor_demand, 1)
-            )
-            f.wage_bill = f.employees * wage
+        _settle_labor(
+            households.employed, households.wealth, hired, np.float32(wage),
+            firms.desired_labor, firms.employees, firms.wage_bill,
+            employed, float(labor_demand)
+        )
 
         return wage, unemployment_rate
 
     # --------------------------------------------------
-    # Goods Market
+    # Goods + Credit Markets and firm accounts
     # --------------------------------------------------
-    def clear_goods_market(self, households, firms):
+    def clear_and_settle(self, households, firms, government):
         """
-        Matches household consumption with firm production.
-        Adjusts prices based on excess demand.
+        Clears the goods and credit markets and settles firm accounts in a
+        single pass over the firms (FirmPopulation.settle).
         """
 
+        price_multiplier, cleared, total_supply = self._goods_market_terms(households, firms)
+        interest_rate = government.current_interest_rate
+
+        firms.settle(price_multiplier, cleared, total_supply, self.max_leverage, interest_rate)
+
+        return price_multiplier, interest_rate
+
+    def _goods_market_terms(self, households, firms):
         # ---- Total demand ----
-        total_demand = sum(h.consumption for h in households)
+        total_demand = households.consumption.sum(dtype=np.float64)
 
         # ---- Total supply ----
-        total_supply = sum(f.production for f in firms)
+        total_supply = firms.production.sum()
 
         # ---- Price adjustment ----
         excess_demand = total_demand - total_supply
         price_multiplier = 1 + self.price_adjustment * np.tanh(excess_demand / max(total_supply, 1))
 
-        for f in firms:
-            f.price *= price_multiplier
-
-        # ---- Revenue allocation ----
-        if total_supply > 0:
-            for f in firms:
-                market_share = f.production / total_supply
-                f.revenue = market_share * min(total_demand, total_supply) * f.price
-        else:
-            for f in firms:
-                f.revenue = 0.0
-
-        return price_multiplier
-
-    # --------------------------------------------------
-    # Credit Market
-    # --------------------------------------------------
-    def clear_credit_market(self, firms, government):
-        """
-        Firms borrow from government / central bank.
-        Credit rationing under high interest or capital controls.
-        """
-
-        interest_rate = government.current_interest_rate
-
-        for f in firms:
-            # Desired borrowing based on negative cash flow
-            if f.capital < 0:
-                desired_credit = abs(f.capital)
-
-                # Capital controls & leverage constraint
-                max_credit = self.max_leverage * max(f.capital + desired_credit, 1)
-                granted_credit = min(desired_credit, max_credit)
-
-                # Interest burden
-                repayment = granted_credit * (1 + interest_rate)
-
-                f.capital += granted_credit
-                f.debt += repayment
-
-        return interest_rate
+        return price_multiplier, min(total_demand, total_supply), total_supply
@@ -4,8 +4,8 @@ import numpy as np
 
 from simulation.state import GlobalState
 from simulation.agents.government import GovernmentAgent
-from simulation.agents.households import HouseholdAgent
-from simulation.agents.firms import FirmAgent
+from simulation.agents.households import HouseholdPopulation
+from simulation.agents.firms import FirmPopulation
 from simulation.economics.markets import MarketMechanism
 from simulation.networks.social_graph import SocialGraph
 from simulation.economics.inequality import InequalityMetrics
@@ -32,41 +32,46 @@ class BlackSwanEnv(gym.Env):
         self.state = GlobalState()
         self.timestep = 0
 
+        # Single generator shared by every stochastic subsystem
+        self.rng = np.random.default_rng(config.get("seed"))
+
         # -----------------------------
         # Agents
         # -----------------------------
         self.government = GovernmentAgent(config)
 
-        self.households = [
-            HouseholdAgent(
-                id=i,
-                social_class=np.random.choice(
-                    ["poor", "working", "middle", "elite"],
-                    p=[0.35, 0.35, 0.2, 0.1]
-                ),
-                config=config
-            )
-            for i in range(config.get("num_households", 200))
-        ]
-
-        self.firms = [
-            FirmAgent(
-                id=i,
-                archetype=np.random.choice(
-                    ["startup", "sme", "mnc"],
-                    p=[0.5, 0.35, 0.15]
-                ),
-                config=config
-            )
-            for i in range(config.get("num_firms", 50))
-        ]
+        self.households = HouseholdPopulation(
+            class_codes=self.rng.choice(
+                len(HouseholdPopulation.SOCIAL_CLASSES),
+                size=config.get("num_households", 200),
+                p=[0.35, 0.35, 0.2, 0.1]
+            ),
+            config=config,
+            rng=self.rng
+        )
+
+        self.firms = FirmPopulation(
+            archetype_codes=self.rng.choice(
+                len(FirmPopulation.ARCHETYPES),
+                size=config.get("num_firms", 50),
+                p=[0.5, 0.35, 0.15]
+            ),
+            config=config
+        )
+
+        # Diffusion writes here, then swaps with households.unrest
+        self._unrest_scratch = np.empty_like(self.households.unrest)
+
+        # Observation buffers, refilled every step
+        self._obs_buf = np.empty(10, dtype=np.float32)
+        self._macro_buf = np.empty(4, dtype=np.float32)
 
         # -----------------------------
         # Systems
         # -----------------------------
-        self.market = MarketMechanism(config)
-        self.social_graph = SocialGraph(len(self.households), config)
-        self.shocks = ShockManager(config)
+        self.market = MarketMechanism(config, rng=self.rng)
+        self.social_graph = SocialGraph(len(self.households), config, rng=self.rng)
+        self.shocks = ShockManager(config, rng=self.rng)
 
         # -----------------------------
         # Spaces (government control)
@@ -93,6 +98,10 @@ class BlackSwanEnv(gym.Env):
         self.state = GlobalState()
         self.timestep = 0
 
+        self.state.household_sizes = self.households.sizes
+        self.state.household_unrest = self.households.unrest
+        self.state.social_adjacency = self.social_graph.adjacency
+
         # Reset government memory
         self.government.prev_gdp = 10000.0
         
@@ -130,24 +139,20 @@ class BlackSwanEnv(gym.Env):
             "inflation": self.state.economics.inflation,
             "interest_rate": self.state.economics.interest_rate
         }
-        for f in self.firms:
-            f.step(market_conditions)
+        self.firms.step(market_conditions)
 
         # -----------------------------
         # 4. Households act
         # -----------------------------
-        household_states = {}
-        for h in self.households:
-            obs = self._household_obs(h)
-            h.act(obs)
-            household_states[h.id] = {"unrest": h.unrest}
+        self.households.act(self._household_macro())
 
         # -----------------------------
         # 5. Social unrest diffusion
         # -----------------------------
-        updated_unrest = self.social_graph.spread_influence(household_states)
-        for h in self.households:
-            h.unrest = updated_unrest[h.id]
+        households = self.households
+        self.social_graph.spread_influence(households.unrest, out=self._unrest_scratch)
+        households.unrest, self._unrest_scratch = self._unrest_scratch, households.unrest
+        self.state.household_unrest = households.unrest
 
         # -----------------------------
         # 6. Market clearing
@@ -155,15 +160,10 @@ class BlackSwanEnv(gym.Env):
         wage, unemployment = self.market.clear_labor_market(self.households, self.firms)
         
         # Firms produce with hired labor
-        for f in self.firms:
-            f.produce()
-            
-        price_multiplier = self.market.clear_goods_market(self.households, self.firms)
-        self.market.clear_credit_market(self.firms, self.government)
-        
-        # Firms settle accounts
-        for f in self.firms:
-            f.post_market_step()
+        self.firms.produce()
+
+        # Goods and credit markets clear, then firms settle accounts
+        price_multiplier, _ = self.market.clear_and_settle(self.households, self.firms, self.government)
 
         # -----------------------------
         # 7. Update macro metrics
@@ -188,29 +188,32 @@ class BlackSwanEnv(gym.Env):
     # --------------------------------------------------
     def _get_obs(self):
         econ = self.state.economics
-
-        return np.array([
-            econ.gdp,
-            econ.inflation,
-            econ.unemployment,
-            econ.gini_coeff,
-            econ.avg_unrest,
-            econ.top1_wealth_share,
-            econ.interest_rate,
-            econ.tax_rate,
-            econ.welfare_spending,
-            econ.capital_controls
-        ], dtype=np.float32)
-
-    def _household_obs(self, h):
+        obs = self._obs_buf
+
+        obs[0] = econ.gdp
+        obs[1] = econ.inflation
+        obs[2] = econ.unemployment
+        obs[3] = econ.gini_coeff
+        obs[4] = econ.avg_unrest
+        obs[5] = econ.top1_wealth_share
+        obs[6] = econ.interest_rate
+        obs[7] = econ.tax_rate
+        obs[8] = econ.welfare_spending
+        obs[9] = econ.capital_controls
+
+        # Callers keep observations across steps, so hand out a copy
+        return obs.copy()
+
+    def _household_macro(self):
+        # Macro part of every household's observation, shared by all of them;
+        # consumed within the step, so the buffer itself is returned
         econ = self.state.economics
-        return np.array([
-            econ.inflation,
-            econ.unemployment,
-            econ.avg_unrest,
-            econ.gdp_growth,
-            h.wealth
-        ], dtype=np.float32)
+        macro = self._macro_buf
+        macro[0] = econ.inflation
+        macro[1] = econ.unemployment
+        macro[2] = econ.avg_unrest
+        macro[3] = econ.gdp_growth
+        return macro
 
     # --------------------------------------------------
     # Macro updates
@@ -219,11 +222,11 @@ class BlackSwanEnv(gym.Env):
         econ = self.state.economics
 
         # GDP
-        econ.gdp = sum(f.revenue for f in self.firms)
+        econ.gdp = float(self.firms.revenue.sum())
 
         # Inflation (price pressure proxy)
         econ.inflation = np.clip(
-            econ.inflation + 0.01 * np.random.randn(),
+            econ.inflation + 0.01 * self.rng.standard_normal(),
             0.0, 1.0
         )
 
@@ -231,12 +234,12 @@ class BlackSwanEnv(gym.Env):
         econ.unemployment = unemployment
 
         # Inequality
-        wealths = [h.wealth for h in self.households]
+        wealths = self.households.wealth
         econ.gini_coeff = InequalityMetrics.calculate_gini(wealths)
         econ.top1_wealth_share = InequalityMetrics.calculate_wealth_share(wealths)
 
         # Unrest
-        econ.avg_unrest = np.mean([h.unrest for h in self.households])
+        econ.avg_unrest = float(self.households.unrest.mean(dtype=np.float64))
 
         # GDP growth
         econ.update_growth()
@@ -0,0 +1,146 @@
+import numpy as np
+from utils.jit import njit, NUMBA_AVAILABLE, FASTMATH
+
+
+# --------------------------------------------------
+# Force-directed layout kernels
+# --------------------------------------------------
+# Fruchterman-Reingold, the same model as nx.spring_layout: k^2 / d
+# repulsion between every pair, d^2 / k attraction along edges, each node
+# moving at most t per iteration while t cools linearly from 0.1.
+# The all-pairs repulsion is cache-blocked: a tile of rows sweeps one tile
+# of columns at a time. Attraction reads the CSR rows, so every node only
+# writes its own displacement.
+# The kernel is serial on purpose: layouts are computed off the sim thread
+# while its parallel kernels run, and numba's default workqueue threading
+# layer aborts on concurrent parallel launches.
+
+@njit(fastmath=FASTMATH, cache=True)
+def _spring_layout_jit(pos, indptr, indices, iterations, tile):
+    n = pos.shape[0]
+    # float32 constants keep the pair loop in single precision (twice the SIMD width)
+    k = np.float32(np.sqrt(1.0 / max(n, 1)))
+    k2 = k * k
+    min_d2 = np.float32(1e-4)
+    t = 0.1
+    dt = t / (iterations + 1)
+    disp = np.zeros_like(pos)
+    num_tiles = (n + tile - 1) // tile
+
+    for _ in range(iterations):
+        for b in range(num_tiles):
+            i0 = b * tile
+            i1 = min(i0 + tile, n)
+            for i in range(i0, i1):
+                disp[i, 0] = 0.0
+                disp[i, 1] = 0.0
+
+            # Repulsion
+            for j0 in range(0, n, tile):
+                j1 = min(j0 + tile, n)
+                for i in range(i0, i1):
+                    xi = pos[i, 0]
+                    yi = pos[i, 1]
+                    fx = np.float32(0.0)
+                    fy = np.float32(0.0)
+                    for j in range(j0, j1):
+                        dx = xi - pos[j, 0]
+                        dy = yi - pos[j, 1]
+                        w = k2 / max(dx * dx + dy * dy, min_d2)
+                        fx += dx * w
+                        fy += dy * w
+                    disp[i, 0] += fx
+                    disp[i, 1] += fy
+
+            # Attraction
+            for i in range(i0, i1):
+                for p in range(indptr[i], indptr[i + 1]):
+                    j = indices[p]
+                    dx = pos[i, 0] - pos[j, 0]
+                    dy = pos[i, 1] - pos[j, 1]
+                    pull = np.sqrt(dx * dx + dy * dy) / k
+                    disp[i, 0] -= dx * pull
+                    disp[i, 1] -= dy * pull
+
+        # Move each node at most t, then cool
+        for i in range(n):
+            length = max(np.sqrt(disp[i, 0] * disp[i, 0] + disp[i, 1] * disp[i, 1]), 0.01)
+            pos[i, 0] += disp[i, 0] * t / length
+            pos[i, 1] += disp[i, 1] * t / length
+        t -= dt
+
+
+def _spring_layout_numpy(pos, indptr, indices, iterations, tile):
+    n = pos.shape[0]
+    k = np.float32(np.sqrt(1.0 / max(n, 1)))
+    t = np.float32(0.1)
+    dt = t / (iterations + 1)
+    disp = np.empty_like(pos)
+
+    # Each undirected edge appears once per endpoint in the CSR
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+
+    for _ in range(iterations):
+        # Repulsion, in row tiles so the pairwise deltas stay (tile, N)
+        x, y = pos[:, 0], pos[:, 1]
+        for start in range(0, n, tile):
+            block = slice(start, start + tile)
+            dx = x[block, None] - x
+            dy = y[block, None] - y
+            w = k * k / np.maximum(dx * dx + dy * dy, 1e-4)
+            disp[block, 0] = (dx * w).sum(axis=1)
+            disp[block, 1] = (dy * w).sum(axis=1)
+
+        # Attraction
+        if indices.size:
+            d = pos[rows] - pos[indices]
+            pull = d * (np.sqrt((d ** 2).sum(axis=1)) / k)[:, None]
+            np.subtract.at(disp, rows, pull)
+
+        # Move each node at most t, then cool
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 0.01)
+        pos += disp * (t / length)[:, None]
+        t -= dt
+
+
+if NUMBA_AVAILABLE:
+    _spring_layout = _spring_layout_jit
+
+    # Compile (or load from cache) at import for float32 positions and int32 CSR
+    _spring_layout(np.zeros((2, 2), dtype=np.float32), np.array([0, 1, 2], dtype=np.int32),
+                   np.array([1, 0], dtype=np.int32), 1, 256)
+else:
+    _spring_layout = _spring_layout_numpy
+
+
+def csr_from_edges(src, dst, num_nodes):
+    """
+    Undirected edge arrays -> int32 CSR (indptr, indices);
+    neighbors of i are indices[indptr[i]:indptr[i + 1]].
+    """
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src]).astype(np.int32)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+    return indptr, cols[np.argsort(rows, kind="stable")]
+
+
+def spring_layout(indptr, indices, pos=None, iterations=50, seed=42, tile=256):
+    """
+    Force-directed node positions for a graph in CSR form.
+    pos: optional (N, 2) warm start; without it nodes start uniformly at random
+    Returns: (N, 2) float32 positions, centered and scaled to [-1, 1]
+    like nx.spring_layout
+    """
+
+    n = len(indptr) - 1
+    if pos is None:
+        pos = np.random.default_rng(seed).random((n, 2), dtype=np.float32)
+    else:
+        pos = np.array(pos, dtype=np.float32)
+
+    _spring_layout(pos, indptr, indices, int(iterations), int(tile))
+
+    pos -= pos.mean(axis=0)
+    pos /= max(float(np.abs(pos).max()), 1e-6)
+    return pos
@@ -1,5 +1,124 @@
-import networkx as nx
 import numpy as np
+from utils.jit import njit, prange, NUMBA_AVAILABLE, FASTMATH
+
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
+
+
+# --------------------------------------------------
+# Graph construction
+# --------------------------------------------------
+# Barabasi-Albert preferential attachment, the same process as
+# nx.barabasi_albert_graph: a star over nodes 0..m seeds the graph, then
+# each new node links to m distinct existing nodes drawn with probability
+# proportional to degree. Sequential by nature, so without numba the
+# same code simply runs as Python.
+
+@njit(cache=True)
+def _barabasi_albert_edges(n, m, rng):
+    num_edges = m + (n - m - 1) * m
+    src = np.empty(num_edges, dtype=np.int32)
+    dst = np.empty(num_edges, dtype=np.int32)
+
+    # Every edge endpoint so far; a uniform draw from it is degree-proportional
+    repeated = np.empty(2 * num_edges, dtype=np.int32)
+
+    for k in range(m):
+        src[k] = 0
+        dst[k] = k + 1
+        repeated[2 * k] = 0
+        repeated[2 * k + 1] = k + 1
+    e = m
+    r = 2 * m
+
+    targets = np.empty(m, dtype=np.int32)
+    for source in range(m + 1, n):
+        found = 0
+        while found < m:
+            t = repeated[rng.integers(0, r)]
+            duplicate = False
+            for j in range(found):
+                if targets[j] == t:
+                    duplicate = True
+                    break
+            if not duplicate:
+                targets[found] = t
+                found += 1
+
+        for j in range(m):
+            src[e] = source
+            dst[e] = targets[j]
+            e += 1
+            repeated[r] = targets[j]
+            repeated[r + 1] = source
+            r += 2
+
+    return src, dst
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import
+    _barabasi_albert_edges(3, 1, np.random.default_rng(0))
+
+
+# --------------------------------------------------
+# Diffusion kernel
+# --------------------------------------------------
+# own + strength * (neighbor_mean - own) - decay * own + noise, clipped to
+# [0, 1], in one pass that reads the CSR rows directly (no temporaries).
+# Isolated agents keep their own unrest.
+
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def _diffuse_jit(unrest, indptr, indices, inv_degrees, noise, out,
+                 strength, decay, noise_scale):
+    for i in prange(unrest.size):
+        own = unrest[i]
+        start, end = indptr[i], indptr[i + 1]
+        if start == end:
+            v = own
+        else:
+            total = 0.0
+            for j in range(start, end):
+                total += unrest[indices[j]]
+            neighbor_unrest = total * inv_degrees[i]
+            v = own + strength * (neighbor_unrest - own) - decay * own + noise_scale * noise[i]
+        out[i] = min(max(v, 0.0), 1.0)
+
+
+def _diffuse_numpy(unrest, indptr, indices, inv_degrees, noise, out,
+                   strength, decay, noise_scale):
+    isolated = indptr[1:] == indptr[:-1]
+
+    # Segmented sum over the CSR rows (isolated rows are overwritten below)
+    if indices.size:
+        pull = np.add.reduceat(unrest[indices], np.minimum(indptr[:-1], indices.size - 1))
+    else:
+        pull = np.zeros_like(unrest)
+    pull *= inv_degrees
+    pull -= unrest
+    pull *= strength
+
+    np.multiply(unrest, 1.0 - decay, out=out)
+    out += pull
+    out += noise_scale * noise
+
+    out[isolated] = unrest[isolated]
+    np.clip(out, 0.0, 1.0, out=out)
+
+
+if NUMBA_AVAILABLE:
+    _diffuse = _diffuse_jit
+
+    # Compile (or load from cache) at import so the first step doesn't pay JIT latency
+    _f = np.zeros(2, dtype=np.float32)
+    _diffuse(_f, np.array([0, 1, 2], dtype=np.int32), np.array([1, 0], dtype=np.int32),
+             np.ones(2, dtype=np.float32), _f, np.zeros(2, dtype=np.float32),
+             np.float32(0.3), np.float32(0.05), np.float32(0.02))
+    del _f
+else:
+    _diffuse = _diffuse_numpy
 
 
 class SocialGraph:
@@ -8,69 +127,100 @@ class SocialGraph:
     Models unrest diffusion and social amplification.
     """
 
-    def __init__(self, num_agents, config):
+    def __init__(self, num_agents, config, rng=None):
         self.config = config
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.num_agents = num_agents
 
         # Scale-free network (opinion leaders exist)
-        self.graph = nx.barabasi_albert_graph(
-            num_agents,
-            config.get("avg_degree", 3)
-        )
+        m = config.get("avg_degree", 3)
+        if m < 1 or m >= num_agents:
+            raise ValueError(
+                f"Barabasi-Albert network must have avg_degree >= 1 and < num_agents, "
+                f"got avg_degree={m}, num_agents={num_agents}"
+            )
+        src, dst = _barabasi_albert_edges(num_agents, m, self.rng)
+
+        # Undirected edge list (E, 2), one row per edge
+        self.edges = np.stack([src, dst], axis=1)
+
+        # Neighbor lists in CSR form: neighbors of i are indices[indptr[i]:indptr[i + 1]]
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        degrees = np.bincount(rows, minlength=num_agents).astype(np.int32)
+        self.indptr = np.zeros(num_agents + 1, dtype=np.int32)
+        np.cumsum(degrees, out=self.indptr[1:])
+        self.indices = cols[np.argsort(rows, kind="stable")]
+
+        # Row scaling constant, computed once
+        self._inv_degrees = (1.0 / np.maximum(degrees, 1)).astype(np.float32)
+        self._isolated = degrees == 0
+
+        # Row-normalized adjacency: (adjacency @ x)[i] is the mean of x over i's neighbors
+        # (None without scipy; neighbor_mean then falls back to a segmented sum)
+        if sp is not None:
+            self.adjacency = sp.csr_array(
+                (np.repeat(self._inv_degrees, degrees), self.indices, self.indptr),
+                shape=(num_agents, num_agents)
+            )
+        else:
+            self.adjacency = None
 
         # Diffusion parameters
         self.influence_strength = config.get("influence_strength", 0.3)
         self.decay = config.get("unrest_decay", 0.05)
         self.noise = config.get("social_noise", 0.02)
 
+        # Standard-normal draws, refilled in place every diffusion step
+        self._noise_buf = np.empty(num_agents, dtype=np.float32)
+
     # --------------------------------------------------
     # Unrest propagation
     # --------------------------------------------------
-    def spread_influence(self, household_states):
+    def spread_influence(self, unrest, out=None):
         """
-        household_states: dict
-            {agent_id: {"unrest": float}}
+        unrest: ndarray (N,) of household unrest indexed by agent id
+        out: optional ndarray (N,) to write into; must not alias unrest
 
         Returns:
-            updated_unrest: dict {agent_id: unrest}
+            updated_unrest: ndarray (N,) (out, if given)
         """
 
-        new_unrest = {}
+        if out is None:
+            out = np.empty_like(unrest)
 
-        for agent_id in self.graph.nodes:
-            neighbors = list(self.graph.neighbors(agent_id))
+        noise = self.rng.standard_normal(out=self._noise_buf, dtype=np.float32)
 
-            own_unrest = household_states[agent_id]["unrest"]
-
-            if not neighbors:
-                new_unrest[agent_id] = self._clip(own_unrest)
-                continue
+        _diffuse(
+            unrest, self.indptr, self.indices, self._inv_degrees, noise, out,
+            np.float32(self.influence_strength), np.float32(self.decay), np.float32(self.noise)
+        )
 
-            # ---- Social influence ----
-            neighbor_unrest = np.mean(
-                [household_states[n]["unrest"] for n in neighbors]
-            )
+        return out
 
-            # ---- Diffusion equation ----
-            propagated = (
-                own_unrest
-                + self.influence_strength * (neighbor_unrest - own_unrest)
-                - self.decay * own_unrest
-                + np.random.normal(0, self.noise)
-            )
+    # --------------------------------------------------
+    # Neighborhood queries
+    # --------------------------------------------------
+    def neighbor_mean(self, values):
+        """
+        Mean of values over each agent's neighbors (own value if isolated).
+        values: ndarray (N,) indexed by agent id
+        """
 
-            new_unrest[agent_id] = self._clip(propagated)
+        if self.adjacency is not None:
+            mean = self.adjacency @ values
+        elif self.indices.size:
+            # Segmented sum over the CSR rows, then the precomputed 1/degree
+            starts = np.minimum(self.indptr[:-1], self.indices.size - 1)
+            mean = np.add.reduceat(values[self.indices], starts)
+            mean *= self._inv_degrees
+        else:
+            mean = np.zeros_like(values)
 
-        return new_unrest
+        mean[self._isolated] = values[self._isolated]
+        return mean
 
-    # --------------------------------------------------
-    # Neighborhood query
-    # --------------------------------------------------
     def get_neighbors(self, agent_id):
-        return list(self.graph.neighbors(agent_id))
-
-    # --------------------------------------------------
-    # Helpers
-    # --------------------------------------------------
-    @staticmethod
-    def _clip(x):
-        return float(np.clip(x, 0.0, 1.0))
+        """Neighbor ids of agent_id as an ndarray view into the CSR indices."""
+        return self.indices[self.indptr[agent_id]:self.indptr[agent_id + 1]]
@@ -5,9 +5,18 @@ class ShockManager:
     """
     Manages random and targeted shocks to the system.
     """
-    def __init__(self, config):
+    # Initial number of shock slots; doubles if ever exhausted
+    SLOTS = 16
+
+    def __init__(self, config, rng=None):
         self.config = config
-        self.active_shocks = []
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Active shocks as fixed-size slot arrays; a slot is live while _active is set
+        self._shock_type = np.empty(self.SLOTS, dtype=object)
+        self._shock_sev = np.zeros(self.SLOTS)
+        self._shock_dur = np.zeros(self.SLOTS, dtype=np.int64)
+        self._active = np.zeros(self.SLOTS, dtype=bool)
         
         # Probabilities for random shocks (Increased for testing)
         self.shock_probs = config.get("shock_probs", {
@@ -16,85 +25,107 @@ class ShockManager:
             "supply_chain_collapse": 0.05
         })
 
+        # Catalog materialized once so each step is one batched draw and compare
+        self._shock_types = np.array(list(self.shock_probs.keys()))
+        self._shock_probs = np.fromiter(self.shock_probs.values(), dtype=np.float64, count=len(self.shock_probs))
+
     def maybe_trigger(self, state, households, firms):
         """
         Check for random shocks or apply active shocks.
         """
         # 1. Random triggers
-        for shock_type, prob in self.shock_probs.items():
-            if np.random.random() < prob:
-                self.add_shock(shock_type, 0.5)
+        fired = self.rng.random(self._shock_probs.shape[0]) < self._shock_probs
+        for shock_type in self._shock_types[fired]:
+            self.add_shock(str(shock_type), 0.5)
 
         # 2. Apply active shocks
-        # Decay shocks
-        alive_shocks = []
-        for shock in self.active_shocks:
-            self._apply_shock(shock, state, households, firms)
-            shock.duration -= 1
-            if shock.duration > 0:
-                alive_shocks.append(shock)
-        
-        self.active_shocks = alive_shocks
+        for k in np.flatnonzero(self._active):
+            self._apply_shock(self._shock_type[k], float(self._shock_sev[k]), state, households, firms)
+
+        # Decay shocks in place; expired slots are freed for reuse
+        np.subtract(self._shock_dur, 1, out=self._shock_dur, where=self._active)
+        self._active &= self._shock_dur > 0
 
     def add_shock(self, shock_type, severity):
         """
         Manual or random injection.
         """
-        duration = 10 if shock_type != 'permanent' else 1000
-        shock = ExogenousShock(
-            type=shock_type,
-            severity=severity,
-            duration=duration,
-            start_step=0 
-        )
-        self.active_shocks.append(shock)
-
-    def _apply_shock(self, shock, state, households, firms):
+        free = np.flatnonzero(~self._active)
+        if free.size == 0:
+            self._grow()
+            free = np.flatnonzero(~self._active)
+
+        k = free[0]
+        self._shock_type[k] = shock_type
+        self._shock_sev[k] = severity
+        self._shock_dur[k] = 10 if shock_type != 'permanent' else 1000
+        self._active[k] = True
+
+    @property
+    def active_shocks(self):
+        """Snapshot of the live shocks (for inspection; not used on the step path)."""
+        return [
+            ExogenousShock(
+                type=self._shock_type[k],
+                severity=float(self._shock_sev[k]),
+                duration=int(self._shock_dur[k]),
+                start_step=0
+            )
+            for k in np.flatnonzero(self._active)
+        ]
+
+    def _grow(self):
+        n = self._active.shape[0]
+        self._shock_type = np.concatenate([self._shock_type, np.empty(n, dtype=object)])
+        self._shock_sev = np.concatenate([self._shock_sev, np.zeros(n)])
+        self._shock_dur = np.concatenate([self._shock_dur, np.zeros(n, dtype=np.int64)])
+        self._active = np.concatenate([self._active, np.zeros(n, dtype=bool)])
+
+    def _apply_shock(self, shock_type, severity, state, households, firms):
         """
         Apply effects based on shock type.
+        households: HouseholdPopulation, firms: FirmPopulation
         """
         econ = state.economics
 
-        if shock.type == "pandemic":
+        if shock_type == "pandemic":
             # Reduces labor supply and consumption
-            econ.unemployment += 5 * shock.severity
-            for h in households:
-                h.consumption *= (1.0 - 2 * shock.severity)
+            econ.unemployment += 5 * severity
+            households.consumption *= (1.0 - 2 * severity)
 
-        elif shock.type == "financial_crash":
+        elif shock_type == "financial_crash":
             # Destroys capital and wealth
-            for f in firms:
-                f.capital *= (1.0 - 8 * shock.severity) # Catastrophic capital destruction
-            for h in households:
-                h.wealth *= (1.0 - 7 * shock.severity) # Massive wealth evaporation
+            firms.capitals *= (1.0 - 8 * severity) # Catastrophic capital destruction
+            households.wealth *= (1.0 - 7 * severity) # Massive wealth evaporation
             
-            econ.unemployment += 40 * shock.severity # Mass unemployment
+            econ.unemployment += 40 * severity # Mass unemployment
 
-        elif shock.type == "political_coup":
+        elif shock_type == "political_coup":
             # Increases unrest huge amount
-            for h in households:
-                h.unrest = np.clip(h.unrest + 20.0 * shock.severity, 0.0, 1.0) # Instant max unrest
-            econ.regime_stability = max(0.0, econ.regime_stability - 1.0 * shock.severity) if hasattr(econ, 'regime_stability') else 0
+            self._raise_unrest(households, 20.0 * severity) # Instant max unrest
+            econ.regime_stability = max(0.0, econ.regime_stability - 1.0 * severity) if hasattr(econ, 'regime_stability') else 0
 
-        elif shock.type == "supply_chain_collapse":
+        elif shock_type == "supply_chain_collapse":
             # Increases inflation, reduces production
-            econ.inflation += 50 * shock.severity # Hyperinflation risk
-            for f in firms:
-                f.productivity *= (1.0 - 6 * shock.severity) # Industry halt
+            econ.inflation += 50 * severity # Hyperinflation risk
+            firms.productivities *= (1.0 - 6 * severity) # Industry halt
         
-        elif shock.type == "cyber_attack":
+        elif shock_type == "cyber_attack":
             # Freezes firm capital and increases unrest
-            for f in firms:
-                f.capital *= (1.0 - 0.1 * shock.severity) # Less destruction, more freeze (simulated by loss)
-            for h in households:
-                 # Panic
-                h.unrest = np.clip(h.unrest + 3 * shock.severity, 0.0, 1.0)
+            firms.capitals *= (1.0 - 0.1 * severity) # Less destruction, more freeze (simulated by loss)
+            # Panic
+            self._raise_unrest(households, 3 * severity)
             
-        elif shock.type == "climate_catastrophe":
+        elif shock_type == "climate_catastrophe":
             # Long term production hit and heavy welfare/wealth cost
-            econ.inflation += 20 * shock.severity
-            econ.unemployment += 10 * shock.severity
-            for f in firms:
-                f.productivity *= (1.0 - 4 * shock.severity)
-            for h in households:
-                h.wealth *= (1.0 - 2 * shock.severity) # Property damage
+            econ.inflation += 20 * severity
+            econ.unemployment += 10 * severity
+            firms.productivities *= (1.0 - 4 * severity)
+            households.wealth *= (1.0 - 2 * severity) # Property damage
+
+    @staticmethod
+    def _raise_unrest(households, amount):
+        # In place on the SoA array so aliases (state.household_unrest) stay valid
+        unrest = households.unrest
+        np.add(unrest, amount, out=unrest)
+        np.clip(unrest, 0.0, 1.0, out=unrest)
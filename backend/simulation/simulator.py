@@ -1,5 +1,7 @@
+import math
 import threading
 import time
+import networkx as nx
 import numpy as np
 from simulation.env import BlackSwanEnv
 from rl.maddpg import MADDPG
@@ -30,11 +32,19 @@ class Simulator:
         # Note: Unemployment is usually an outcome, but we can perhaps influence initial firm count or labor demand?
         # For now, let's just stick to macro seeding.
 
+        # Households actually simulated; full scale is opt-in
+        households = yaml_config["agents"]["households"]
+        if households.get("full_scale", False):
+            num_households = int(households["count"])
+        else:
+            num_households = int(households["count"] / 1000)
+
         # Flatten/Map config to env expectations
         self.config = {
-            "num_households": int(yaml_config["agents"]["households"]["count"] / 1000), # Scale down for performance
+            "num_households": num_households,
             "num_firms": yaml_config["agents"]["firms"]["count"],
             "max_steps": yaml_config["simulation"]["steps"],
+            "step_delay": yaml_config["simulation"].get("step_delay", 0.0),
             "shock_probs": {
                 "pandemic": 0.001,
             },
@@ -47,12 +57,26 @@ class Simulator:
         # Obs dim: [inflation, unemployment, unrest, inequality, gdp] = 5
         # Act dim: [interest, tax, welfare, controls] = 4
         self.agent = MADDPG(5, 4, yaml_config)
+
+        # Government observation buffers, refilled every step
+        self._gov_state = np.empty(5, dtype=np.float32)
+        self._next_gov_state = np.empty(5, dtype=np.float32)
         
+        # Real-time pacing of the run loop (0 = no throttle)
+        self.step_delay = self.config.get("step_delay", 0.0)
+
         self.running = False
         self.thread = None
         self.metrics_history = []
         self.latest_metrics = {}
 
+        # The social graph never mutates, so its node-link form is built once
+        # per graph; the version lets clients skip re-fetching it
+        self._network_data = None
+        self._network_graph = None
+        self._network_version = 0
+        self._network_lock = threading.Lock()  # get_metrics may be called from several threads
+
     # ... (start/stop/metrics remain same)
 
     def start(self):
@@ -69,15 +93,42 @@ class Simulator:
     def add_shock(self, shock_type, severity):
         self.env.shocks.add_shock(shock_type, severity)
 
-    def get_metrics(self):
+    def get_metrics(self, network_version=None):
         # Convert internal state to serializable dict
+        # network is None when the caller already holds network_version
+        metrics = self._snapshot(network_version)
+        metrics["history"] = self.metrics_history[-50:] # Send last 50 points
+        return metrics
+
+    def get_metrics_batch(self, since_row=0, network_version=None):
+        """
+        History rows from index since_row of metrics_history on, plus the
+        current snapshot (get_metrics without "history"), so a poller
+        receives each row once however many steps ran between polls.
+        metrics_history only grows, so a row's index is a cursor that keeps
+        increasing across env resets (unlike the step, which restarts).
+        since_row: number of rows the caller has already consumed
+        Returns: (start_row, rows, snapshot); the next since_row is
+        start_row + len(rows)
+        """
+        history = self.metrics_history
+        end = len(history)  # the run loop keeps appending meanwhile
+        start = min(since_row, end)
+        return start, history[start:end], self._snapshot(network_version)
+
+    def _snapshot(self, network_version):
+        network = self._get_network_data()
+        if network_version == self._network_version:
+            network = None
         return {
+            "step": self.env.timestep,
             "gdp_growth": float(self.env.state.economics.gdp_growth) if hasattr(self.env.state.economics, 'gdp_growth') else 0.0,
             "inflation": float(self.env.state.economics.inflation),
             "unemployment": float(self.env.state.economics.unemployment),
             "unrest": float(self.env.state.economics.avg_unrest),
-            "history": self.metrics_history[-50:], # Send last 50 points
-            "network": self._get_network_data()
+            "network_version": self._network_version,
+            "network": network,
+            "node_unrest": self.env.state.household_unrest.tolist()
         }
 
     def _run_loop(self):
@@ -87,16 +138,7 @@ class Simulator:
             # Gov agent act expects: [inflation, unemployment, unrest, inequality, gdp_level]
             # obs from env: [gdp, inflation, unemployment, gini, avg_unrest, top1, rate, tax, welfare, controls]
             
-            # Note: We need to normalize GDP for neural net 
-            norm_gdp = np.tanh(self.obs[0] / 100000.0) 
-            
-            gov_state = np.array([
-                self.obs[1], # inflation
-                self.obs[2], # unemployment
-                self.obs[4], # unrest
-                self.obs[3], # inequality (gini)
-                norm_gdp     # gdp (normalized)
-            ])
+            gov_state = self._fill_gov_state(self._gov_state, self.obs)
             
             # 2. Select Action (with noise for exploration)
             action = self.agent.select_action(gov_state, noise=0.1)
@@ -105,10 +147,7 @@ class Simulator:
             next_obs, reward, terminated, truncated, info = self.env.step(action)
             
             # 4. Store Experience
-            next_norm_gdp = np.tanh(next_obs[0] / 100000.0)
-            next_gov_state = np.array([
-                next_obs[1], next_obs[2], next_obs[4], next_obs[3], next_norm_gdp
-            ])
+            next_gov_state = self._fill_gov_state(self._next_gov_state, next_obs)
             
             self.agent.memory.push(gov_state, action, reward, next_gov_state, terminated)
             
@@ -133,15 +172,30 @@ class Simulator:
             if terminated or truncated:
                 self.obs, _ = self.env.reset()
                 
-            time.sleep(0.5) # Speed up slightly
+            if self.step_delay:
+                time.sleep(self.step_delay)
+
+    @staticmethod
+    def _fill_gov_state(dest, obs):
+        dest[0] = obs[1]  # inflation
+        dest[1] = obs[2]  # unemployment
+        dest[2] = obs[4]  # unrest
+        dest[3] = obs[3]  # inequality (gini)
+        # Note: We need to normalize GDP for neural net (math.tanh: scalar, no ufunc dispatch)
+        dest[4] = math.tanh(obs[0] / 100000.0)
+        return dest
 
     def _get_network_data(self):
         # Format social graph for frontend
-        # Use node_link_data for standard compatibility
-        G = self.env.social_graph.graph
-        # Convert to standard format
+        # Use node_link_data for standard compatibility ('links' key)
         # Filter data to reduce size if needed, but for now send full
-        import networkx as nx 
-        data = nx.node_link_data(G)
-        # Ensure 'links' key is used (default in new nx versions)
-        return data
+        social_graph = self.env.social_graph
+        with self._network_lock:
+            if self._network_graph is not social_graph:
+                G = nx.Graph()
+                G.add_nodes_from(range(social_graph.num_agents))
+                G.add_edges_from(social_graph.edges.tolist())
+                self._network_data = nx.node_link_data(G, edges="links")
+                self._network_graph = social_graph
+                self._network_version += 1
+            return self._network_data
@@ -49,6 +49,9 @@ class GlobalState:
     firms: Dict[str, Any] = field(default_factory=dict)
     government: Dict[str, Any] = field(default_factory=dict)
     network: Any = None  # SocialGraph or other network reference
+    social_adjacency: Any = None  # Row-normalized CSR adjacency over household ids (None without scipy)
+    household_sizes: Any = None  # np.ndarray, population weight per household
+    household_unrest: Any = None  # np.ndarray, kept in sync with household unrest
     shocks: List[Dict] = field(default_factory=list)
 
     # -----------------------------
@@ -0,0 +1,23 @@
+"""
+Optional Numba acceleration.
+
+Kernels decorated with njit are compiled when numba is installed and run
+as plain Python otherwise, so numba stays an optional dependency.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Supports both @njit and @njit(cache=True, ...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# fastmath flags minus nnan/ninf: runaway prices can legitimately reach inf,
+# so kernels must not let LLVM assume finite values
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-import networkx as nx
+import plotly.io as pio
+import numpy as np
+from collections import deque
+import queue
+import threading
 import time
 import sys
 import os
@@ -11,6 +13,15 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
 
 from simulation.simulator import Simulator
+from simulation.networks.layout import csr_from_edges, spring_layout
+
+# st.plotly_chart serializes every figure through plotly.io.to_json;
+# use orjson for it when installed (optional, stdlib json otherwise)
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
 
 # -----------------------------
 # Config
@@ -18,7 +29,7 @@ from simulation.simulator import Simulator
 st.set_page_config(page_title="Black Swan | Dystopian Sim", layout="wide", page_icon="🦢")
 
 # Custom CSS for Dystopian Theme
-st.markdown("""
+THEME_CSS = """
 <style>
     .stApp { background-color: #0a0a0c; color: #e0e0e0; }
     .stButton>button { background-color: #1a1a20; color: #ff3333; border: 1px solid #ff3333; width: 100%; }
@@ -26,8 +37,11 @@ st.markdown("""
     .metric-card { background-color: #111113; padding: 20px; border-radius: 5px; border: 1px solid #333; text-align: center; }
     .metric-value { font-size: 2em; font-weight: bold; color: #0088ff; }
     .metric-label { font-size: 0.8em; text-transform: uppercase; color: #888; }
+    .metric-row { display: flex; gap: 1rem; margin-bottom: 1rem; }
+    .metric-row .metric-card { flex: 1; }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(THEME_CSS, unsafe_allow_html=True)
 
 # -----------------------------
 # State Management
@@ -61,67 +75,391 @@ def inject_shock(shock_type, severity):
     except Exception as e:
         st.error(f"Error injecting shock: {e}")
 
+class MetricsFeed:
+    """
+    Daemon thread that polls the simulator and hands the UI, per new step,
+    the history rows recorded since its last poll plus the latest snapshot
+    (sim.get_metrics_batch), through a small queue. Metrics are built off
+    the Streamlit script thread, and each history row crosses only once.
+    The queue holds at most two batches; when the UI falls behind, the
+    queued batches are folded into the newest one, so no row is dropped.
+    """
+
+    POLL_S = 0.05
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.queue = queue.Queue(maxsize=2)
+        # Network version the UI has drawn; the payload is sent until it matches
+        self.network_version = None
+        self.thread = None
+
+    def alive(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, since_row):
+        """since_row: number of simulator history rows the UI already holds"""
+        if not self.alive():
+            self.thread = threading.Thread(target=self._run, args=(since_row,), daemon=True)
+            self.thread.start()
+
+    def _run(self, since_row):
+        seen_step = None
+        while self.sim.running:
+            if self.sim.env.timestep != seen_step:
+                start, rows, snapshot = self.sim.get_metrics_batch(since_row, network_version=self.network_version)
+                seen_step = snapshot["step"]
+                since_row = start + len(rows)
+                try:
+                    self.queue.put_nowait((start, rows, snapshot))
+                except queue.Full:
+                    # The UI fell behind: fold every queued batch into this one,
+                    # oldest first (single producer, so the put then fits;
+                    # batches are contiguous, so the oldest start holds)
+                    queued = []
+                    while True:
+                        try:
+                            queued_start, queued_rows, _ = self.queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if not queued:
+                            start = queued_start
+                        queued += queued_rows
+                    self.queue.put_nowait((start, queued + rows, snapshot))
+            time.sleep(self.POLL_S)
+
+    def latest(self, timeout=0.0):
+        """
+        All queued rows and the newest snapshot as (start_row, rows, snapshot),
+        or None if nothing arrived; timeout > 0 waits that long for a first batch.
+        """
+        try:
+            start, rows, snapshot = self.queue.get(timeout=timeout) if timeout else self.queue.get_nowait()
+        except queue.Empty:
+            return None
+        while True:
+            try:
+                _, more_rows, snapshot = self.queue.get_nowait()
+            except queue.Empty:
+                return start, rows, snapshot
+            rows = rows + more_rows
+
+if 'feed' not in st.session_state:
+    st.session_state['feed'] = MetricsFeed(sim)
+
+feed = st.session_state['feed']
+
 def fetch_metrics():
+    """
+    Returns (start_row, new history rows, metrics snapshot); rows begin at
+    simulator history index start_row (see HistoryBuffer.extend).
+    """
     try:
-        # Get metrics directly from simulator instance
-        return sim.get_metrics()
+        # The network payload only comes back when it differs from the
+        # version already drawn
+        cached = st.session_state.get('net_graph')
+        network_version = cached[0] if cached else None
+        feed.network_version = network_version
+        memo = st.session_state.get('metrics_memo')
+        
+        # While the simulation runs, batches arrive from the feed thread;
+        # an empty queue means no new step, so the last snapshot is reused
+        if sim.running:
+            feed.start(history_buffer.next_row)
+        batch = feed.latest(timeout=1.0 if memo is None and feed.alive() else 0.0)
+        if batch is not None:
+            start, rows, metrics = batch
+            st.session_state['metrics_memo'] = ((metrics["step"], network_version), metrics)
+            return start, rows, metrics
+        
+        if memo is not None and (feed.alive() or memo[0] == (sim.env.timestep, network_version)):
+            return history_buffer.next_row, [], memo[1]
+        
+        # Stopped: fetch directly, once per step (never beside the feed,
+        # which would hand out the same rows again)
+        if not feed.alive():
+            start, rows, metrics = sim.get_metrics_batch(history_buffer.next_row, network_version=network_version)
+            st.session_state['metrics_memo'] = ((metrics["step"], network_version), metrics)
+            return start, rows, metrics
     except Exception as e:
         # st.error(f"Error fetching metrics: {e}")
         pass
-    return {
+    return history_buffer.next_row, [], {
         "gdp_growth": 0.0,
         "inflation": 0.0,
         "unemployment": 0.0,
         "unrest": 0.0,
-        "history": [],
-        "network": None
+        "network_version": None,
+        "network": None,
+        "node_unrest": []
     }
 
-def plot_network(graph_dict):
+def network_layout(indptr, indices):
+    """
+    Node positions (N, 2) for the CSR graph, cached in st.session_state['net_pos']
+    across refreshes. The topology rarely changes, so the cache is keyed by a
+    cheap fingerprint; on a change the previous positions warm-start a short
+    relayout.
+    """
+    num_nodes = len(indptr) - 1
+    key = hash((num_nodes, len(indices) // 2))
+    cached = st.session_state.get('net_pos')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    if cached is None:
+        pos = spring_layout(indptr, indices, iterations=50, seed=42)
+    else:
+        # Surviving nodes keep their positions, new ones start at random
+        prev_pos = cached[1]
+        init = np.random.default_rng(42).random((num_nodes, 2), dtype=np.float32) * 2 - 1
+        keep = min(num_nodes, len(prev_pos))
+        init[:keep] = prev_pos[:keep]
+        pos = spring_layout(indptr, indices, pos=init, iterations=5)
+
+    st.session_state['net_pos'] = (key, pos)
+    return pos
+
+def chart_figure(name, build):
+    """
+    go.Figure created once per session and kept in st.session_state.
+    Refreshes only mutate its trace data, so the browser gets a
+    Plotly.react diff instead of a full newPlot.
+    """
+    if name not in st.session_state:
+        st.session_state[name] = build()
+    return st.session_state[name]
+
+def dark_template():
+    """
+    plotly_dark resolved to a plain dict once per session, so building
+    figures doesn't look it up and deep-copy it from the template registry.
+    """
+    if 'dark_template' not in st.session_state:
+        st.session_state['dark_template'] = pio.templates["plotly_dark"].to_plotly_json()
+    return st.session_state['dark_template']
+
+def build_macro_figure():
+    layout = go.Layout(
+        title="Economic Trajectory", template=dark_template(),
+        paper_bgcolor="#111113", plot_bgcolor="#111113",
+        xaxis_title="step", yaxis_title="value", legend_title_text="variable",
+        uirevision="macro"  # keep zoom/legend state across updates
+    )
+    return go.Figure(data=[
+        go.Scattergl(name=name, x=[], y=[], mode='lines')
+        for name in HISTORY_COLUMNS[1:]
+    ], layout=layout)
+
+def build_network_figure():
+    edge_trace = go.Scattergl(
+        x=[], y=[], line=dict(width=0.5, color='#888'), hoverinfo='none', mode='lines'
+    )
+    # Hover text is formatted in the browser from the node ids (customdata)
+    # and the unrest already sent as marker colors, instead of N strings per redraw
+    node_trace = go.Scattergl(
+        name='households', x=[], y=[], mode='markers', customdata=[],
+        hovertemplate="Household %{customdata}<br>Unrest: %{marker.color:.2f}<extra></extra>",
+        marker=dict(color=[], colorscale='Reds', cmin=0.0, cmax=1.0, showscale=False, size=10)
+    )
+
+    fig = go.Figure(data=[edge_trace, node_trace])
+    fig.update_layout(
+        paper_bgcolor="#111113", 
+        plot_bgcolor="#111113", 
+        showlegend=False,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        uirevision="network"
+    )
+    return fig
+
+HISTORY_COLUMNS = ["step", "gdp", "inflation", "unemployment", "unrest"]
+
+class HistoryBuffer:
+    """
+    Macro history preallocated as one float32 block, one row per step.
+    New rows are written in place; when the block fills, the older half is
+    dropped in one move, so appends stay amortized O(1).
+    """
+
+    def __init__(self, capacity):
+        self.rows = np.empty((capacity, len(HISTORY_COLUMNS)), dtype=np.float32)
+        self.loc = 0
+        self.last_step = None
+        self.next_row = 0  # simulator history rows consumed so far
+
+    def extend(self, start_row, rows):
+        """
+        rows: metrics history rows from get_metrics_batch, beginning at
+        simulator history index start_row; written as one block.
+        Rows before next_row are already held and skipped. A step lower
+        than the one before it starts a new episode, which restarts the
+        buffer so stored steps stay increasing.
+        Returns: whether anything was written
+        """
+        skip = max(self.next_row - start_row, 0)
+        rows = rows[skip:]
+        if not rows:
+            return False
+        self.next_row = start_row + skip + len(rows)
+
+        # Keep only the current episode
+        prev = self.last_step
+        first = 0
+        for i, row in enumerate(rows):
+            if prev is not None and row["step"] <= prev:
+                first = i
+                self.loc = 0
+            prev = row["step"]
+        rows = rows[first:]
+
+        block = np.array([[row[c] for c in HISTORY_COLUMNS] for row in rows], dtype=np.float32)
+        capacity = len(self.rows)
+        block = block[-capacity:]
+
+        if self.loc + len(block) > capacity:
+            keep = min(self.loc, capacity // 2, capacity - len(block))
+            self.rows[:keep] = self.rows[self.loc - keep:self.loc]
+            self.loc = keep
+        self.rows[self.loc:self.loc + len(block)] = block
+        self.loc += len(block)
+        self.last_step = rows[-1]["step"]
+        return True
+
+    def view(self):
+        """Stored rows (a view, no copy); columns follow HISTORY_COLUMNS."""
+        return self.rows[:self.loc]
+
+# Past this many points a series is LTTB-downsampled before it is sent
+MAX_CHART_POINTS = 1000
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points that keep the
+    visual shape of (x, y). The first and last points are always kept.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+
+    # n_out - 2 interior buckets over points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+
+    # Each bucket is scored against the mean of the next one (the last
+    # against the final point), so all means are computed up front
+    avg_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i] - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+def update_macro_figure(history):
+    """
+    history: HistoryBuffer; each trace gets column views of its rows,
+    LTTB-downsampled to MAX_CHART_POINTS once the run gets long.
+    """
+    fig = chart_figure('macro_fig', build_macro_figure)
+    rows = history.view()
+    with fig.batch_update():
+        for col, trace in enumerate(fig.data, start=1):
+            keep = lttb_indices(rows[:, 0], rows[:, col], MAX_CHART_POINTS)
+            trace.x = rows[keep, 0]
+            trace.y = rows[keep, col]
+    return fig
+
+def plot_network(graph_dict, version, node_unrest):
+    """
+    graph_dict: node-link payload, or None when this version is already drawn
+    node_unrest: per-household unrest; recolors the nodes on every call
+    """
     try:
-        # Correctly parse graph including edge data
-        G = nx.node_link_graph(graph_dict)
-        pos = nx.spring_layout(G, seed=42)
-        
-        edge_x, edge_y = [], []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x += [x0, x1, None]
-            edge_y += [y0, y1, None]
-        
-        edge_trace = go.Scatter(
-            x=edge_x, y=edge_y, line=dict(width=0.5, color='#888'), hoverinfo='none', mode='lines'
-        )
+        if graph_dict is None and 'net_graph' not in st.session_state:
+            return None
+        if graph_dict is not None and len(graph_dict.get("nodes", [])) == 0:
+            return None
         
-        node_x, node_y, node_text = [], [], []
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            # Unrest might be missing if not populated, default to 0
-            u_val = G.nodes[node].get('unrest', 0)
-            node_text.append(f"Household {node}<br>Unrest: {u_val:.2f}")
+        fig = chart_figure('net_fig', build_network_figure)
         
-        node_trace = go.Scatter(
-            x=node_x, y=node_y, mode='markers', text=node_text, hoverinfo='text',
-            marker=dict(color='#ff3333', size=10)
-        )
+        if graph_dict is not None:
+            # Read the node-link payload directly as arrays (no networkx graph);
+            # node ids are kept per version
+            nodes = graph_dict["nodes"]
+            links = graph_dict["links"]
+            node_ids = np.fromiter((node["id"] for node in nodes), dtype=np.int64, count=len(nodes))
+            src = np.fromiter((link["source"] for link in links), dtype=np.int64, count=len(links))
+            dst = np.fromiter((link["target"] for link in links), dtype=np.int64, count=len(links))
+            
+            # Link endpoints are node ids; map them to row positions
+            order = np.argsort(node_ids, kind="stable")
+            ei = order[np.searchsorted(node_ids, src, sorter=order)].astype(np.int32)
+            ej = order[np.searchsorted(node_ids, dst, sorter=order)].astype(np.int32)
+            num_edges = len(links)
+            
+            pos_arr = network_layout(*csr_from_edges(ei, ej, len(node_ids)))
+            
+            # Edge polyline: (x0, x1, NaN) per edge, NaN breaks the line
+            edge_x = np.empty(3 * num_edges)
+            edge_y = np.empty(3 * num_edges)
+            edge_x[0::3], edge_x[1::3], edge_x[2::3] = pos_arr[ei, 0], pos_arr[ej, 0], np.nan
+            edge_y[0::3], edge_y[1::3], edge_y[2::3] = pos_arr[ei, 1], pos_arr[ej, 1], np.nan
+            
+            with fig.batch_update():
+                fig.data[0].update(x=edge_x, y=edge_y)
+                fig.data[1].update(x=pos_arr[:, 0], y=pos_arr[:, 1], customdata=node_ids)
+            st.session_state['net_graph'] = (version, node_ids)
         
-        fig = go.Figure(data=[edge_trace, node_trace])
-        fig.update_layout(
-            paper_bgcolor="#111113", 
-            plot_bgcolor="#111113", 
-            showlegend=False,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
-        )
+        node_ids = st.session_state['net_graph'][1]
+        if len(node_unrest) == len(node_ids):
+            # Only the node colors change between versions
+            fig.update_traces(marker_color=np.asarray(node_unrest, dtype=np.float32),
+                              selector=dict(name='households'))
         return fig
     except Exception as e:
         print(f"Graph Error: {e}")
         return None
 
+# Live refresh backs off from 1 s to 10 s while the metrics stand still
+MIN_REFRESH_S = 1.0
+MAX_REFRESH_S = 10.0
+
+# Mirrors document.visibilityState into the page URL (?visible=0/1) so the
+# server can tell a backgrounded tab; Streamlit reads it at each script run
+VISIBILITY_JS = """
+<script>
+const sync = () => {
+    const url = new URL(window.parent.location);
+    url.searchParams.set("visible", document.visibilityState === "visible" ? "1" : "0");
+    window.parent.history.replaceState(null, "", url);
+};
+window.parent.document.addEventListener("visibilitychange", sync);
+sync();
+</script>
+"""
+
+def page_visible():
+    return st.query_params.get("visible", "1") != "0"
+
+# Macro history for the chart, sized for one full episode
+if 'history_buffer' not in st.session_state:
+    st.session_state['history_buffer'] = HistoryBuffer(sim.config["max_steps"])
+
+history_buffer = st.session_state['history_buffer']
+
 # -----------------------------
 # Layout
 # -----------------------------
@@ -151,62 +489,125 @@ with col1:
     else:
         st.info("System Status: IDLE")
 
+# --- Refresh toggle ---
+# Live updates are the user's call: unchecked, the panel stays on the last
+# drawn state until the next interaction
+auto_refresh = st.sidebar.checkbox("Auto-refresh", value=True)
+
 # --- Metrics & Charts ---
-with col2:
-    # Metric placeholders
-    m_col1, m_col2, m_col3, m_col4 = st.columns(4)
-    gdp_card = m_col1.empty()
-    inflation_card = m_col2.empty()
-    unemployment_card = m_col3.empty()
-    unrest_card = m_col4.empty()
+if 'live' not in st.session_state:
+    st.session_state['live'] = {"refresh_s": MIN_REFRESH_S, "last_step": None, "network_step": None}
+
+live = st.session_state['live']
+
+# Frame-time budget: seconds per stage over the last 60 live-panel runs.
+# "net" is the network chart's steady cost (recolor + send); runs that lay
+# out a new graph are left out. Past the budget the chart is paused.
+FRAME_STAGES = ("fetch", "macro", "net", "frame")
+NETWORK_BUDGET_S = 0.5
+
+if 'frame_times' not in st.session_state:
+    st.session_state['frame_times'] = {stage: deque(maxlen=60) for stage in FRAME_STAGES}
+
+frame_times = st.session_state['frame_times']
+
+def network_p95():
+    samples = frame_times["net"]
+    return float(np.percentile(samples, 95)) if len(samples) >= 10 else 0.0
+
+# (label, metrics key, format spec) per card
+METRIC_CARDS = [
+    ("GDP Growth", "gdp_growth", ".2%"),
+    ("Inflation", "inflation", ".2%"),
+    ("Unemployment", "unemployment", ".2%"),
+    ("Social Unrest", "unrest", ".2f"),
+]
+
+def live_panel(run_every):
+    """
+    Metric cards and charts. Runs as a fragment: while the simulation runs
+    it reruns on its own every run_every seconds, without re-executing the
+    CSS, controls and layout above.
+    """
+    t_frame = time.perf_counter()
+    start_row, new_rows, metrics = fetch_metrics()
+    frame_times["fetch"].append(time.perf_counter() - t_frame)
+    step = metrics.get("step", 0)
+    
+    # Metric cards, sent as one element
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div><div class="metric-value">{metrics[key]:{fmt}}</div></div>'
+        for label, key, fmt in METRIC_CARDS
+    )
+    st.markdown(f'<div class="metric-row">{cards}</div>', unsafe_allow_html=True)
+    
+    # Nothing new since the last run: re-send the figures as they are and back off
+    # (the run right after a reschedule keeps the interval it asked for)
+    changed = step != live["last_step"]
+    if run_every is not None and not live.pop("rescheduled", False):
+        live["refresh_s"] = MIN_REFRESH_S if changed else min(2 * live["refresh_s"], MAX_REFRESH_S)
+    
+    net_p95 = network_p95()
+    network_on = net_p95 <= NETWORK_BUDGET_S
+    t_net = 0.0
+    relayout = False
+    
+    # Update macro chart with the rows recorded since the last run
+    if new_rows:
+        t0 = time.perf_counter()
+        if history_buffer.extend(start_row, new_rows):
+            update_macro_figure(history_buffer)
+        frame_times["macro"].append(time.perf_counter() - t0)
+    
+    if changed:
+        live["last_step"] = step
+        
+        # Update social network at most once per 5 steps (it's heavy),
+        # and not at all while the tab is hidden or the chart is paused
+        network_step = live["network_step"]
+        if network_on and (network_step is None or step // 5 != network_step // 5) and page_visible():
+            live["network_step"] = step
+            relayout = metrics.get("network") is not None
+            t0 = time.perf_counter()
+            plot_network(metrics.get("network", None), metrics["network_version"], metrics["node_unrest"])
+            t_net += time.perf_counter() - t0
     
     # Charts tabs
     tab1, tab2 = st.tabs(["MACROECONOMICS", "SOCIAL NETWORK"])
     with tab1:
-        macro_chart = st.empty()
+        if 'macro_fig' in st.session_state:
+            st.plotly_chart(st.session_state['macro_fig'], width="stretch", key="macro")
     with tab2:
-        network_chart = st.empty()
+        if not network_on:
+            st.caption(f"Network view paused: p95 {net_p95 * 1000:.0f} ms is over the {NETWORK_BUDGET_S * 1000:.0f} ms budget")
+            st.button("Resume network view", on_click=frame_times["net"].clear)
+        elif 'net_graph' in st.session_state:
+            t0 = time.perf_counter()
+            st.plotly_chart(st.session_state['net_fig'], width="stretch", key="network")
+            t_net += time.perf_counter() - t0
+            if not relayout:
+                frame_times["net"].append(t_net)
     
-    # --- Live update loop ---
-    if sim.running:
-        while True:
-            metrics = fetch_metrics()
-            
-            # Update metric cards
-            gdp_card.markdown(f'<div class="metric-card"><div class="metric-label">GDP Growth</div><div class="metric-value">{metrics["gdp_growth"]:.2%}</div></div>', unsafe_allow_html=True)
-            inflation_card.markdown(f'<div class="metric-card"><div class="metric-label">Inflation</div><div class="metric-value">{metrics["inflation"]:.2%}</div></div>', unsafe_allow_html=True)
-            unemployment_card.markdown(f'<div class="metric-card"><div class="metric-label">Unemployment</div><div class="metric-value">{metrics["unemployment"]:.2%}</div></div>', unsafe_allow_html=True)
-            unrest_card.markdown(f'<div class="metric-card"><div class="metric-label">Social Unrest</div><div class="metric-value">{metrics["unrest"]:.2f}</div></div>', unsafe_allow_html=True)
-            
-            # Update macro chart
-            history = pd.DataFrame(metrics.get("history", []))
-            if not history.empty:
-                fig = px.line(history, x="step", y=["gdp", "inflation", "unemployment", "unrest"], 
-                              title="Economic Trajectory", template="plotly_dark")
-                fig.update_layout(paper_bgcolor="#111113", plot_bgcolor="#111113")
-                macro_chart.plotly_chart(fig, use_container_width=True)
-            
-            # Update social network (throttle this, it's heavy)
-            if metrics.get("step", 0) % 5 == 0:
-                network_dict = metrics.get("network", None)
-                if network_dict and len(network_dict.get("nodes", [])) > 0:
-                    fig_net = plot_network(network_dict)
-                    if fig_net:
-                        network_chart.plotly_chart(fig_net, use_container_width=True)
-            
-            time.sleep(1)
-            # Rerun script check? No, local loop. 
-            # Streamlit warns about loops. but we are in a 'while True' inside 'if sim.running'. 
-            # Ideally we rely on st.rerun() but for smooth animation a loop is often used.
-            # We break if simulation stops.
-            if not sim.running:
-                st.rerun() 
-                break
+    frame_times["frame"].append(time.perf_counter() - t_frame)
+    lines = ["Frame time p50 / p95 (ms)"]
+    for stage, samples in frame_times.items():
+        if samples:
+            p50, p95 = np.percentile(samples, [50, 95]) * 1000
+            lines.append(f"{stage}: {p50:.0f} / {p95:.0f}")
+    st.sidebar.caption("  \n".join(lines))
+    
+    # run_every is fixed when the fragment is registered, so a backed-off
+    # interval needs one full run to take effect
+    if run_every is not None and live["refresh_s"] != run_every:
+        live["rescheduled"] = True
+        st.rerun(scope="app")
+
+with col2:
+    if sim.running and auto_refresh:
+        # st.iframe rejects height=0; 1 px is the smallest allowed
+        st.iframe(VISIBILITY_JS, height=1)
+        run_every = live["refresh_s"]
     else:
         # Static view of last known state
-        metrics = fetch_metrics()
-        gdp_card.markdown(f'<div class="metric-card"><div class="metric-label">GDP Growth</div><div class="metric-value">{metrics["gdp_growth"]:.2%}</div></div>', unsafe_allow_html=True)
-        inflation_card.markdown(f'<div class="metric-card"><div class="metric-label">Inflation</div><div class="metric-value">{metrics["inflation"]:.2%}</div></div>', unsafe_allow_html=True)
-        unemployment_card.markdown(f'<div class="metric-card"><div class="metric-label">Unemployment</div><div class="metric-value">{metrics["unemployment"]:.2%}</div></div>', unsafe_allow_html=True)
-        unrest_card.markdown(f'<div class="metric-card"><div class="metric-label">Social Unrest</div><div class="metric-value">{metrics["unrest"]:.2f}</div></div>', unsafe_allow_html=True)
-
+        run_every = None
+    st.fragment(live_panel, run_every=run_every)(run_every)
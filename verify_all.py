@@ -0,0 +1,108 @@
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import networkx as nx
+
+# Add backend directory to python path (relative to this file, any machine)
+sys.path.append(str(Path(__file__).resolve().parent / "backend"))
+
+# Runs the four verify_* checks in one process, so the Simulator stack
+# (torch, numba kernels, data loader) is imported and initialized once.
+
+
+def check_data(sim):
+    # Check if config was updated
+    raw_config = sim.config.get("raw_config", {})
+    init_gdp = raw_config.get("economics", {}).get("initial_gdp", 0)
+    print(f"Configured Initial GDP: {init_gdp}")
+
+    # Sanity check
+    if init_gdp > 1e12:
+        print("SUCCESS: Simulation seeded with Real World GDP scale.")
+        return True
+    print("WARNING: GDP seems low, data loader might have failed.")
+    return False
+
+
+def check_graph(sim):
+    print("Getting Network Data...")
+    net_data = sim._get_network_data()
+    print(f"Network Data Keys: {net_data.keys()}")
+
+    print("Reconstructing Graph...")
+    G = nx.node_link_graph(net_data, edges="links")
+    print(f"Reconstructed Graph: {len(G.nodes)} nodes, {len(G.edges)} edges")
+
+    if len(G.nodes) > 0:
+        print("SUCCESS: Social Graph logic is valid.")
+        return True
+    print("FAILURE: Graph is empty.")
+    return False
+
+
+def check_backend(sim):
+    print("Starting Simulation...")
+    sim.start()
+
+    time.sleep(3)
+
+    print("Getting Metrics...")
+    metrics = sim.get_metrics()
+    print("Metrics:", list(metrics.keys()))
+
+    print("Stopping Simulation...")
+    sim.stop()
+
+    print("SUCCESS: Simulation ran for 3 seconds.")
+    return True
+
+
+def check_maddpg(sim):
+    print("Config Loaded:", sim.config['num_households'], "households (from yaml/scale)")
+    print("Agent Initialized:", sim.agent)
+
+    print("Starting Simulation...")
+    sim.start()
+
+    time.sleep(5)
+
+    print("Metrics History Length:", len(sim.metrics_history))
+    if len(sim.metrics_history) > 0:
+        print("Latest Metric:", sim.metrics_history[-1])
+
+    print("Stopping Simulation...")
+    sim.stop()
+
+    print("SUCCESS: Simulation ran with MADDPG agent.")
+    return len(sim.metrics_history) > 0
+
+
+CHECKS = [check_data, check_graph, check_backend, check_maddpg]
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    print("Importing Simulator...")
+    from simulation.simulator import Simulator
+
+    print("Initializing Simulator...")
+    sim = Simulator()
+    print(f"Ready in {time.perf_counter() - t0:.1f}s")
+
+    results = {}
+    for check in CHECKS:
+        print(f"\n--- {check.__name__} ---")
+        try:
+            results[check.__name__] = check(sim)
+        except Exception as e:
+            print(f"FAILED: {e}")
+            traceback.print_exc()
+            results[check.__name__] = False
+            sim.stop()
+
+    print("\n--- Summary ---")
+    for name, ok in results.items():
+        print(f"{'PASS' if ok else 'FAIL'}  {name}")
+
+    sys.exit(0 if all(results.values()) else 1)
@@ -1,9 +1,7 @@
 import sys
-import os
-import time
 
-# Add root directory to python path
-sys.path.append(os.path.abspath("d:/Black Swan/backend"))
+# Importing verify_all also adds the backend directory to python path
+from verify_all import check_backend
 
 try:
     print("Importing Simulator...")
@@ -12,19 +10,7 @@ try:
     print("Initializing Simulator...")
     sim = Simulator()
     
-    print("Starting Simulation...")
-    sim.start()
-    
-    time.sleep(3)
-    
-    print("Getting Metrics...")
-    metrics = sim.get_metrics()
-    print("Metrics:", list(metrics.keys()))
-    
-    print("Stopping Simulation...")
-    sim.stop()
-    
-    print("SUCCESS: Simulation ran for 3 seconds.")
+    check_backend(sim)
 
 except Exception as e:
     print(f"FAILED: {e}")
@@ -1,9 +1,7 @@
 import sys
-import os
-import networkx as nx
 
-# Add root directory to python path
-sys.path.append(os.path.abspath("d:/Black Swan/backend"))
+# Importing verify_all also adds the backend directory to python path
+from verify_all import check_graph
 
 try:
     print("Importing Simulator...")
@@ -12,18 +10,7 @@ try:
     print("Initializing Simulator...")
     sim = Simulator()
     
-    print("Getting Network Data...")
-    net_data = sim._get_network_data()
-    print(f"Network Data Keys: {net_data.keys()}")
-    
-    print("Reconstructing Graph...")
-    G = nx.node_link_graph(net_data)
-    print(f"Reconstructed Graph: {len(G.nodes)} nodes, {len(G.edges)} edges")
-    
-    if len(G.nodes) > 0:
-        print("SUCCESS: Social Graph logic is valid.")
-    else:
-        print("FAILURE: Graph is empty.")
+    check_graph(sim)
 
 except Exception as e:
     print(f"FAILED: {e}")
@@ -1,9 +1,7 @@
 import sys
-import os
-import time
 
-# Add root directory to python path
-sys.path.append(os.path.abspath("d:/Black Swan/backend"))
+# Importing verify_all also adds the backend directory to python path
+from verify_all import check_maddpg
 
 try:
     print("Importing Simulator...")
@@ -12,22 +10,7 @@ try:
     print("Initializing Simulator...")
     sim = Simulator()
     
-    print("Config Loaded:", sim.config['num_households'], "households (from yaml/scale)")
-    print("Agent Initialized:", sim.agent)
-    
-    print("Starting Simulation...")
-    sim.start()
-    
-    time.sleep(5)
-    
-    print("Metrics History Length:", len(sim.metrics_history))
-    if len(sim.metrics_history) > 0:
-        print("Latest Metric:", sim.metrics_history[-1])
-        
-    print("Stopping Simulation...")
-    sim.stop()
-    
-    print("SUCCESS: Simulation ran with MADDPG agent.")
+    check_maddpg(sim)
 
 except Exception as e:
     print(f"FAILED: {e}")